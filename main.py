@@ -11,6 +11,8 @@ License: MIT
 """
 
 import argparse
+import os
+import stat
 import sys
 from pathlib import Path
 from typing import Optional, List, Any
@@ -19,10 +21,40 @@ from typing import Optional, List, Any
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from src.core.export_photos import PhotoExporter
+# Only the lightweight configuration is imported eagerly; logging, the exporter
+# and performance monitoring are imported when needed so that --help and
+# --version do not load Pillow, lxml, psutil and loguru.
 from src.core.config import get_config
-from src.logging.logger_config import setup_logging, log_info, log_error, log_warning
-from src.utils.performance_monitor import get_performance_monitor
+
+
+# Application banner, built once at import
+_BANNER = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    Apple Photos Management Tool v2.0.0                      ║
+║                                                                              ║
+║  🚀 Professional photo export and organization tool                         ║
+║  📸 Supports HEIC, JPG, MOV, XMP, AAE and more                             ║
+║  ⚡ Advanced performance optimization and monitoring                        ║
+║  🏗️  Modular architecture following SOLID principles                       ║
+║                                                                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+    """
+
+
+# Configuration summary, formatted once and logged with a single call
+_CONFIGURATION_TEMPLATE = (
+    "Configuration:\n"
+    "📁 Source: {source_dir}\n"
+    "📁 Target: {target_dir}\n"
+    "⚙️  Mode: {mode}\n"
+    "🔄 Duplicate Strategy: {duplicate_strategy}\n"
+    "👥 Workers: {workers}\n"
+    "📦 Batch Size: {batch_size}\n"
+    "📊 Log Level: {log_level}\n"
+    "💾 Cache Size: {cache_size}\n"
+    "🧠 Memory Optimization: {memory_optimization}\n"
+    "📈 Performance Monitoring: {performance_monitoring}"
+)
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -112,6 +144,12 @@ For more information, see README.md or docs/requirements.md
         help='Enable performance monitoring and optimization (default: True)'
     )
     
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Do not print the application banner'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
@@ -123,15 +161,19 @@ For more information, see README.md or docs/requirements.md
 
 def validate_arguments(args: argparse.Namespace) -> bool:
     """Validate command line arguments."""
+    from src.logging.logger_config import log_error
+    
     try:
         config = get_config()
         
-        # Validate source directory
-        if not args.source_dir.exists():
+        # Validate source directory (single stat call)
+        try:
+            source_stat = os.stat(args.source_dir)
+        except FileNotFoundError:
             log_error(f"Source directory does not exist: {args.source_dir}")
             return False
         
-        if not args.source_dir.is_dir():
+        if not stat.S_ISDIR(source_stat.st_mode):
             log_error(f"Source path is not a directory: {args.source_dir}")
             return False
         
@@ -140,29 +182,19 @@ def validate_arguments(args: argparse.Namespace) -> bool:
             args.target_dir = args.source_dir.parent / f"{args.source_dir.name}_export"
         
         # Validate numeric arguments using configuration limits
-        if args.workers < config.processing.MIN_WORKERS:
-            log_error(f"Number of workers must be at least {config.processing.MIN_WORKERS}")
-            return False
-        
-        if args.workers > config.processing.MAX_WORKERS:
-            log_error(f"Number of workers cannot exceed {config.processing.MAX_WORKERS}")
-            return False
-        
-        if args.batch_size < config.processing.MIN_BATCH_SIZE:
-            log_error(f"Batch size must be at least {config.processing.MIN_BATCH_SIZE}")
-            return False
-        
-        if args.batch_size > config.processing.MAX_BATCH_SIZE:
-            log_error(f"Batch size cannot exceed {config.processing.MAX_BATCH_SIZE}")
-            return False
-        
-        if args.cache_size < 1:
-            log_error("Cache size must be at least 1")
-            return False
-        
-        if args.cache_size > config.processing.MAX_CACHE_SIZE:
-            log_error(f"Cache size cannot exceed {config.processing.MAX_CACHE_SIZE}")
-            return False
+        processing = config.processing
+        limits = (
+            ("Number of workers", args.workers, processing.MIN_WORKERS, processing.MAX_WORKERS),
+            ("Batch size", args.batch_size, processing.MIN_BATCH_SIZE, processing.MAX_BATCH_SIZE),
+            ("Cache size", args.cache_size, 1, processing.MAX_CACHE_SIZE),
+        )
+        for name, value, minimum, maximum in limits:
+            if value < minimum:
+                log_error(f"{name} must be at least {minimum}")
+                return False
+            if value > maximum:
+                log_error(f"{name} cannot exceed {maximum}")
+                return False
         
         return True
         
@@ -173,44 +205,42 @@ def validate_arguments(args: argparse.Namespace) -> bool:
 
 def print_banner():
     """Print application banner."""
-    banner = """
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                    Apple Photos Management Tool v2.0.0                      ║
-║                                                                              ║
-║  🚀 Professional photo export and organization tool                         ║
-║  📸 Supports HEIC, JPG, MOV, XMP, AAE and more                             ║
-║  ⚡ Advanced performance optimization and monitoring                        ║
-║  🏗️  Modular architecture following SOLID principles                       ║
-║                                                                              ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-    """
-    print(banner)
+    print(_BANNER)
 
 
 def print_configuration(args: argparse.Namespace):
     """Print configuration summary."""
-    log_info("Configuration:")
-    log_info(f"📁 Source: {args.source_dir}")
-    log_info(f"📁 Target: {args.target_dir}")
-    log_info(f"⚙️  Mode: {'DRY-RUN' if args.mode == 'dry' else 'EXECUTE'}")
-    log_info(f"🔄 Duplicate Strategy: {args.duplicate_strategy}")
-    log_info(f"👥 Workers: {args.workers}")
-    log_info(f"📦 Batch Size: {args.batch_size}")
-    log_info(f"📊 Log Level: {args.log_level}")
-    log_info(f"💾 Cache Size: {args.cache_size}")
-    log_info(f"🧠 Memory Optimization: {'Enabled' if args.memory_optimization else 'Disabled'}")
-    log_info(f"📈 Performance Monitoring: {'Enabled' if args.performance_monitoring else 'Disabled'}")
+    from src.logging.logger_config import log_info
+    
+    log_info(_CONFIGURATION_TEMPLATE.format(
+        source_dir=args.source_dir,
+        target_dir=args.target_dir,
+        mode='DRY-RUN' if args.mode == 'dry' else 'EXECUTE',
+        duplicate_strategy=args.duplicate_strategy,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        log_level=args.log_level,
+        cache_size=args.cache_size,
+        memory_optimization='Enabled' if args.memory_optimization else 'Disabled',
+        performance_monitoring='Enabled' if args.performance_monitoring else 'Disabled',
+    ))
 
 
 def main() -> int:
     """Main application entry point."""
+    # Parse command line arguments before the heavy imports below, so
+    # --help and --version exit without any setup
+    parser = create_parser()
+    args = parser.parse_args()
+    
+    from src.core.export_photos import PhotoExporter
+    from src.logging.logger_config import setup_logging, log_info, log_error, log_warning
+    from src.utils.performance_monitor import get_performance_monitor
+    
     try:
-        # Parse command line arguments
-        parser = create_parser()
-        args = parser.parse_args()
-        
         # Print banner
-        print_banner()
+        if not args.quiet:
+            print_banner()
         
         # Validate arguments
         if not validate_arguments(args):
@@ -238,6 +268,7 @@ def main() -> int:
             target_dir=args.target_dir,
             duplicate_strategy=args.duplicate_strategy,
             max_workers=args.workers,
+            batch_size=args.batch_size,
             is_dry_run=(args.mode == 'dry')
         )
         
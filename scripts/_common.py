@@ -0,0 +1,111 @@
+"""
+Shared helpers for the setup and deployment scripts.
+
+Author: AI Assistant
+Version: 2.0.0
+License: MIT
+"""
+
+import functools
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# "Version: x.y.z" line of the main.py module docstring
+_VERSION_RE = re.compile(r'^\s*Version:\s*(.+?)\s*$', re.MULTILINE)
+
+
+def run_command(command: List[str], cwd: Optional[Path] = None, verbose: bool = False) -> bool:
+    """
+    Run a command and return success status.
+    
+    Only stderr is captured, for the failure message. Standard output is
+    discarded, or passed through to the terminal when verbose is set.
+    
+    Args:
+        command: Command to run as list of strings
+        cwd: Working directory for the command
+        verbose: Show the command's standard output
+        
+    Returns:
+        True if command succeeded, False otherwise
+    """
+    try:
+        # close_fds=False is one of the conditions for subprocess to use
+        # posix_spawn instead of fork+exec (our own descriptors are
+        # non-inheritable anyway). CPython also requires cwd to be None and
+        # command[0] to be a path with a directory part, e.g. the venv python;
+        # calls with a cwd or a bare command name still fork+exec.
+        subprocess.run(
+            command,
+            cwd=cwd,
+            stdout=None if verbose else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+            close_fds=False
+        )
+        print(f"✅ {command[0]} completed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ {command[0]} failed: {e}")
+        if e.stderr:
+            print(f"STDERR: {e.stderr}")
+        return False
+    except FileNotFoundError:
+        print(f"❌ Command not found: {command[0]}")
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def get_version() -> str:
+    """Get current version from main.py, read once per run."""
+    main_py = Path(__file__).parent.parent / "main.py"
+    
+    try:
+        match = _VERSION_RE.search(main_py.read_text())
+        if match:
+            return match.group(1)
+    except Exception:
+        pass
+    
+    return "2.0.0"
+
+
+def _write_file(path: Path, mode: Optional[int], content: str) -> None:
+    """Write a generated file and set its mode."""
+    path.write_text(content, encoding='utf-8')
+    if mode is not None:
+        path.chmod(mode)
+
+
+def write_files(files: List[Tuple[Path, Optional[int], str]]) -> bool:
+    """
+    Write generated text files such as launcher scripts.
+    
+    The files are independent, so they are written concurrently.
+    
+    Args:
+        files: (path, mode or None to keep the default, content) tuples
+        
+    Returns:
+        True if all files were written, False otherwise
+    """
+    with ThreadPoolExecutor(max_workers=len(files) or 1) as executor:
+        futures = [
+            (path, executor.submit(_write_file, path, mode, content))
+            for path, mode, content in files
+        ]
+    
+    success = True
+    for path, future in futures:
+        try:
+            future.result()
+            print(f"✅ Created {path.name}")
+        except Exception as e:
+            print(f"❌ Failed to create {path}: {e}")
+            success = False
+    
+    return success
@@ -11,65 +11,35 @@ License: MIT
 """
 
 import argparse
+import gzip
+import hashlib
 import json
+import mmap
+import os
 import shutil
+import stat
 import subprocess
 import sys
 import tarfile
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+# Add project root to path for the shared script helpers
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
 
-def run_command(command: List[str], cwd: Optional[Path] = None) -> bool:
-    """
-    Run a command and return success status.
-    
-    Args:
-        command: Command to run as list of strings
-        cwd: Working directory for the command
-        
-    Returns:
-        True if command succeeded, False otherwise
-    """
-    try:
-        result = subprocess.run(
-            command,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        print(f"✅ {command[0]} completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {command[0]} failed: {e}")
-        if e.stdout:
-            print(f"STDOUT: {e.stdout}")
-        if e.stderr:
-            print(f"STDERR: {e.stderr}")
-        return False
-    except FileNotFoundError:
-        print(f"❌ Command not found: {command[0]}")
-        return False
-
-
-def get_version() -> str:
-    """Get current version from main.py."""
-    main_py = Path(__file__).parent.parent / "main.py"
-    
-    try:
-        with open(main_py, 'r') as f:
-            content = f.read()
-            for line in content.split('\n'):
-                if 'Version:' in line:
-                    return line.split('Version:')[1].strip()
-    except Exception:
-        pass
-    
-    return "2.0.0"
+from scripts._common import get_version, write_files
 
+# Optional BLAKE3 hasher, only needed for --checksum blake3
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 
 def create_build_info(project_root: Path) -> Dict[str, str]:
     """Create build information."""
@@ -82,11 +52,26 @@ def create_build_info(project_root: Path) -> Dict[str, str]:
     }
 
 
-def clean_build_directory(build_dir: Path) -> bool:
-    """Clean build directory."""
-    print(f"🧹 Cleaning build directory: {build_dir}")
+# Manifest of copied source files, kept in the build directory between runs
+BUILDINFO_FILE = ".buildinfo.json"
+
+
+def clean_build_directory(build_dir: Path, full: bool = False) -> bool:
+    """
+    Prepare the build directory.
     
-    if build_dir.exists():
+    Existing builds are kept so that copy_source_files only copies changed
+    files; pass full=True to wipe the directory first.
+    
+    Args:
+        build_dir: Build directory
+        full: Remove the previous build completely
+        
+    Returns:
+        True if the build directory is ready, False otherwise
+    """
+    if full and build_dir.exists():
+        print(f"🧹 Cleaning build directory: {build_dir}")
         try:
             shutil.rmtree(build_dir)
         except Exception as e:
@@ -95,15 +80,229 @@ def clean_build_directory(build_dir: Path) -> bool:
     
     try:
         build_dir.mkdir(parents=True, exist_ok=True)
-        print(f"✅ Created build directory: {build_dir}")
+        print(f"✅ Build directory ready: {build_dir}")
         return True
     except Exception as e:
         print(f"❌ Failed to create build directory: {e}")
         return False
 
 
-def copy_source_files(project_root: Path, build_dir: Path) -> bool:
-    """Copy source files to build directory."""
+def load_buildinfo(build_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Load the file manifest of the previous build, empty if there is none."""
+    try:
+        with open(build_dir / BUILDINFO_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_buildinfo(build_dir: Path, manifest: Dict[str, Dict[str, Any]]) -> None:
+    """Save the file manifest of the current build."""
+    with open(build_dir / BUILDINFO_FILE, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+
+def _file_sha256(path: str) -> str:
+    """
+    Calculate the SHA256 of a file.
+    
+    The file is memory-mapped and hashed with a single update call, which
+    lets the hash run at the speed of the CPU's SHA extensions; empty files
+    cannot be mapped and are read normally.
+    """
+    with open(path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                return hashlib.sha256(mapped).hexdigest()
+        except ValueError:
+            return hashlib.sha256(f.read()).hexdigest()
+
+
+def _file_blake3(path: str) -> str:
+    """Calculate the BLAKE3 of a memory-mapped file using all cores."""
+    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    hasher.update_mmap(path)
+    return hasher.hexdigest()
+
+
+def _copy_file_contents(src: str, dst: str) -> None:
+    """
+    Copy file contents, inside the kernel with copy_file_range where available.
+    
+    copy_file_range lets btrfs and XFS share extents (reflink) and avoids
+    moving data through user space elsewhere. shutil.copyfile, which uses
+    sendfile on Linux and fcopyfile on macOS, is the fallback, for example
+    for cross-filesystem copies on kernels older than 5.3.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+            return
+        except OSError:
+            pass
+    
+    shutil.copyfile(src, dst)
+
+
+def _copy_with_stat(src: str, dst: str, src_stat: os.stat_result) -> None:
+    """Copy file contents and restore mode and times from an already taken stat."""
+    _copy_file_contents(src, dst)
+    _apply_stat(dst, src_stat)
+
+
+def _apply_stat(dst: str, src_stat: os.stat_result) -> None:
+    """Set the times and mode of a copied file."""
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+
+
+def _sync_file(src: str, dst: str, src_stat: os.stat_result, rel_path: str,
+               old_manifest: Dict[str, Dict[str, Any]],
+               new_manifest: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Copy a file into the build unless the previous build already has it.
+    
+    Size and mtime are compared first. The SHA256 is only calculated when
+    they differ, so that a file which was merely touched gets new times
+    instead of a full copy.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path
+        src_stat: Stat result of the source file
+        rel_path: Path relative to the build directory, the manifest key
+        old_manifest: Manifest of the previous build
+        new_manifest: Manifest of the current build, updated in place
+    """
+    entry = {'size': src_stat.st_size, 'mtime_ns': src_stat.st_mtime_ns}
+    previous = old_manifest.get(rel_path)
+    
+    if previous and os.path.exists(dst):
+        if previous['size'] == entry['size'] and previous['mtime_ns'] == entry['mtime_ns']:
+            new_manifest[rel_path] = previous
+            return
+        
+        if previous['size'] == entry['size']:
+            entry['sha256'] = _file_sha256(src)
+            if entry['sha256'] == (previous.get('sha256') or _file_sha256(dst)):
+                _apply_stat(dst, src_stat)
+                new_manifest[rel_path] = entry
+                return
+    
+    _copy_with_stat(src, dst, src_stat)
+    new_manifest[rel_path] = entry
+
+
+def parallel_copytree(trees: List[Tuple[Path, Path, str]], exclude_items: List[str],
+                      workers: Optional[int] = None,
+                      old_manifest: Optional[Dict[str, Dict[str, Any]]] = None,
+                      new_manifest: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+    """
+    Copy directory trees with a single scandir walk and one thread pool.
+    
+    All destination directories are created up front, then the file copies
+    are submitted largest first so that big files do not end up last on a
+    single thread.
+    
+    Args:
+        trees: (source directory, destination directory, manifest key prefix) tuples
+        exclude_items: fnmatch patterns of file and directory names to skip
+        workers: Number of copy threads (default: twice the CPU count)
+        old_manifest: Manifest of the previous build, unchanged files are skipped
+        new_manifest: Manifest of the current build, updated in place
+    """
+    workers = workers or (os.cpu_count() or 1) * 2
+    old_manifest = {} if old_manifest is None else old_manifest
+    new_manifest = {} if new_manifest is None else new_manifest
+    
+    directories = []
+    jobs = []
+    pending = [(str(src), str(dst), rel_root) for src, dst, rel_root in trees]
+    
+    while pending:
+        src_dir, dst_dir, rel_dir = pending.pop()
+        directories.append(dst_dir)
+        
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                if any(fnmatch(entry.name, pattern) for pattern in exclude_items):
+                    continue
+                
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    pending.append((entry.path, target, f"{rel_dir}{entry.name}/"))
+                else:
+                    # Reuse the scandir stat instead of letting copy2 stat again
+                    jobs.append((entry.path, target, entry.stat(), rel_dir + entry.name))
+    
+    # Parents are always listed before their subdirectories
+    for directory in directories:
+        os.makedirs(directory, exist_ok=True)
+    
+    jobs.sort(key=lambda job: job[2].st_size, reverse=True)
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_sync_file, *job, old_manifest, new_manifest)
+            for job in jobs
+        ]
+        
+        # Surface the first copy error, if any
+        for future in futures:
+            future.result()
+
+
+def _fast_copytree(src: Path, dst: Path, exclude_items: List[str]) -> bool:
+    """
+    Copy a directory tree with the platform's native copy tool.
+    
+    Uses robocopy on Windows and rsync elsewhere, both mirror the source so
+    files deleted from it are also removed from an existing build.
+    
+    Args:
+        src: Source directory
+        dst: Destination directory
+        exclude_items: fnmatch patterns of file and directory names to skip
+        
+    Returns:
+        True if the tree was copied, False if no tool is available or it failed
+    """
+    if sys.platform == 'win32':
+        tool = shutil.which('robocopy')
+        if not tool:
+            return False
+        command = [tool, str(src), str(dst), '/MT:64', '/MIR', '/NFL', '/NDL', '/NJH', '/NJS']
+        command += ['/XD', *exclude_items, '/XF', *exclude_items]
+        # robocopy exit codes below 8 mean success
+        max_ok_code = 7
+    else:
+        tool = shutil.which('rsync')
+        if not tool:
+            return False
+        command = [tool, '-a', '--delete', *(f'--exclude={item}' for item in exclude_items),
+                   f'{src}{os.sep}', f'{dst}{os.sep}']
+        max_ok_code = 0
+    
+    try:
+        result = subprocess.run(command, capture_output=True, text=True)
+    except OSError:
+        return False
+    
+    return result.returncode <= max_ok_code
+
+
+def copy_source_files(project_root: Path, build_dir: Path, native_copy: bool = False) -> bool:
+    """
+    Copy source files to build directory.
+    
+    Directories are copied incrementally against the build manifest. With
+    native_copy they are mirrored by rsync/robocopy instead, falling back to
+    the incremental copy when the tool is missing or fails.
+    """
     print("📁 Copying source files...")
     
     # Files and directories to include
@@ -138,34 +337,57 @@ def copy_source_files(project_root: Path, build_dir: Path) -> bool:
     ]
     
     try:
+        old_manifest = load_buildinfo(build_dir)
+        new_manifest: Dict[str, Dict[str, Any]] = {}
+        # Directories mirrored by a native tool are not tracked in the manifest
+        mirrored_items = []
+        # Remaining directories are copied together in one walk
+        trees = []
+        
         for item in include_items:
             src = project_root / item
             dst = build_dir / item
             
             if src.is_file():
-                shutil.copy2(src, dst)
+                _sync_file(str(src), str(dst), src.stat(), item, old_manifest, new_manifest)
                 print(f"✅ Copied file: {item}")
             elif src.is_dir():
-                shutil.copytree(src, dst, ignore=shutil.ignore_patterns(*exclude_items))
-                print(f"✅ Copied directory: {item}")
+                if native_copy and _fast_copytree(src, dst, exclude_items):
+                    mirrored_items.append(item)
+                    print(f"✅ Copied directory: {item}")
+                else:
+                    trees.append((src, dst, item))
             else:
                 print(f"⚠️  Item not found: {item}")
         
+        if trees:
+            parallel_copytree(trees, exclude_items, old_manifest=old_manifest,
+                              new_manifest=new_manifest)
+            for _, _, item in trees:
+                print(f"✅ Copied directory: {item}")
+        
+        # Remove files that were deleted from the source since the last build
+        stale_files = [
+            rel_path for rel_path in old_manifest.keys() - new_manifest.keys()
+            if not rel_path.startswith(tuple(mirrored_items))
+        ]
+        for rel_path in stale_files:
+            (build_dir / rel_path).unlink(missing_ok=True)
+        
+        copied = sum(1 for rel_path, entry in new_manifest.items()
+                     if old_manifest.get(rel_path) is not entry)
+        print(f"✅ {copied} files updated, {len(new_manifest) - copied} unchanged, "
+              f"{len(stale_files)} removed")
+        
+        save_buildinfo(build_dir, new_manifest)
         return True
     except Exception as e:
         print(f"❌ Failed to copy source files: {e}")
         return False
 
 
-def create_launcher_scripts(build_dir: Path) -> bool:
-    """Create launcher scripts for different platforms."""
-    print("🚀 Creating launcher scripts...")
-    
-    # Unix/Linux/Mac launcher
-    unix_launcher = build_dir / "run.sh"
-    try:
-        with open(unix_launcher, 'w') as f:
-            f.write("""#!/bin/bash
+# Contents of the files generated into the build directory
+UNIX_LAUNCHER = """#!/bin/bash
 # Apple Photos Management Tool Launcher
 
 # Check if virtual environment exists
@@ -180,18 +402,9 @@ source venv/bin/activate
 
 # Run the application
 python main.py "$@"
-""")
-        unix_launcher.chmod(0o755)
-        print("✅ Created Unix launcher: run.sh")
-    except Exception as e:
-        print(f"❌ Failed to create Unix launcher: {e}")
-        return False
-    
-    # Windows launcher
-    windows_launcher = build_dir / "run.bat"
-    try:
-        with open(windows_launcher, 'w') as f:
-            f.write("""@echo off
+"""
+
+WINDOWS_LAUNCHER = """@echo off
 REM Apple Photos Management Tool Launcher
 
 REM Check if virtual environment exists
@@ -206,23 +419,9 @@ call venv\\Scripts\\activate.bat
 
 REM Run the application
 python main.py %*
-""")
-        print("✅ Created Windows launcher: run.bat")
-    except Exception as e:
-        print(f"❌ Failed to create Windows launcher: {e}")
-        return False
-    
-    return True
-
+"""
 
-def create_installer_script(build_dir: Path) -> bool:
-    """Create installer script."""
-    print("📦 Creating installer script...")
-    
-    installer = build_dir / "install.py"
-    try:
-        with open(installer, 'w') as f:
-            f.write("""#!/usr/bin/env python3
+INSTALLER_SCRIPT = """#!/usr/bin/env python3
 \"\"\"
 Installer for Apple Photos Management Tool.
 
@@ -269,23 +468,9 @@ def main():
 
 if __name__ == "__main__":
     main()
-""")
-        installer.chmod(0o755)
-        print("✅ Created installer script: install.py")
-        return True
-    except Exception as e:
-        print(f"❌ Failed to create installer script: {e}")
-        return False
-
+"""
 
-def create_dockerfile(build_dir: Path) -> bool:
-    """Create Dockerfile for containerization."""
-    print("🐳 Creating Dockerfile...")
-    
-    dockerfile = build_dir / "Dockerfile"
-    try:
-        with open(dockerfile, 'w') as f:
-            f.write("""# Apple Photos Management Tool Dockerfile
+DOCKERFILE = """# Apple Photos Management Tool Dockerfile
 FROM python:3.11-slim
 
 # Set working directory
@@ -321,22 +506,9 @@ EXPOSE 8000
 
 # Default command
 CMD ["python", "main.py", "--help"]
-""")
-        print("✅ Created Dockerfile")
-        return True
-    except Exception as e:
-        print(f"❌ Failed to create Dockerfile: {e}")
-        return False
-
+"""
 
-def create_docker_compose(build_dir: Path) -> bool:
-    """Create docker-compose.yml for easy deployment."""
-    print("🐳 Creating docker-compose.yml...")
-    
-    compose_file = build_dir / "docker-compose.yml"
-    try:
-        with open(compose_file, 'w') as f:
-            f.write("""version: '3.8'
+DOCKER_COMPOSE = """version: '3.8'
 
 services:
   apple-photos-management:
@@ -367,15 +539,194 @@ services:
   #     - LOG_LEVEL=INFO
   #   command: ["python", "web_app.py"]
   #   restart: unless-stopped
-""")
-        print("✅ Created docker-compose.yml")
-        return True
-    except Exception as e:
-        print(f"❌ Failed to create docker-compose.yml: {e}")
-        return False
+"""
+
+
+def create_build_files(build_dir: Path, include_docker: bool = True) -> bool:
+    """
+    Write launcher scripts, the installer and Docker files into the build directory.
+    
+    Args:
+        build_dir: Build directory
+        include_docker: Also write Dockerfile and docker-compose.yml
+        
+    Returns:
+        True if all files were written, False otherwise
+    """
+    print("🚀 Creating launcher, installer and Docker files...")
+    
+    # (file name, mode or None to keep the default, content)
+    files = [
+        ("run.sh", 0o755, UNIX_LAUNCHER),
+        ("run.bat", None, WINDOWS_LAUNCHER),
+        ("install.py", 0o755, INSTALLER_SCRIPT),
+    ]
+    if include_docker:
+        files += [
+            ("Dockerfile", None, DOCKERFILE),
+            ("docker-compose.yml", None, DOCKER_COMPOSE),
+        ]
+    
+    return write_files([(build_dir / name, mode, content) for name, mode, content in files])
 
 
-def create_package_archive(build_dir: Path, output_dir: Path, format: str = "tar.gz") -> bool:
+# Archive defaults: gzip/deflate level and tar stream block size
+DEFAULT_COMPRESS_LEVEL = 6
+TAR_BUFFER_SIZE = 1 << 20
+# Files read ahead of the zip writer
+ZIP_READ_AHEAD = 16
+
+
+def _iter_files(root: str) -> Iterator[Tuple[str, str]]:
+    """
+    Walk a directory tree with os.scandir.
+    
+    Args:
+        root: Directory to walk
+        
+    Yields:
+        Tuples of (absolute path, '/'-separated path relative to root)
+    """
+    pending = [(root, "")]
+    while pending:
+        base, rel_dir = pending.pop()
+        with os.scandir(base) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, f"{rel_dir}{entry.name}/"))
+                else:
+                    yield entry.path, rel_dir + entry.name
+
+
+def _archive_entries(build_dir: Path) -> List[Tuple[str, str]]:
+    """
+    List the files to package, sorted by archive name for reproducible archives.
+    
+    Bytecode caches left over from running the build and the build manifest
+    are skipped.
+    
+    Args:
+        build_dir: Build directory
+        
+    Returns:
+        List of (absolute path, path relative to build_dir) tuples
+    """
+    return sorted(
+        (
+            (file_path, rel_path) for file_path, rel_path in _iter_files(str(build_dir))
+            if rel_path != BUILDINFO_FILE
+            and not rel_path.endswith(('.pyc', '.pyo'))
+            and '__pycache__/' not in f"/{rel_path}"
+        ),
+        key=lambda entry: entry[1]
+    )
+
+
+def _add_tar_entries(tar: tarfile.TarFile, build_dir: Path, arcname: str,
+                     entries: List[Tuple[str, str]]) -> None:
+    """
+    Add the top-level directory and then each listed file, without recursion.
+    
+    Each subdirectory is added just before the first file inside it, so the
+    archive keeps directory modes and mtimes in sorted order.
+    """
+    tar.add(build_dir, arcname=arcname, recursive=False)
+    added_dirs = set()
+    for file_path, rel_path in entries:
+        parts = rel_path.split('/')[:-1]
+        for depth in range(1, len(parts) + 1):
+            rel_dir = '/'.join(parts[:depth])
+            if rel_dir not in added_dirs:
+                added_dirs.add(rel_dir)
+                tar.add(os.path.join(build_dir, rel_dir), arcname=f"{arcname}/{rel_dir}",
+                        recursive=False)
+        tar.add(file_path, arcname=f"{arcname}/{rel_path}", recursive=False)
+
+
+def _write_tar_gz(build_dir: Path, archive_path: Path, arcname: str,
+                  compress_level: int = DEFAULT_COMPRESS_LEVEL) -> None:
+    """
+    Write a gzip-compressed tarball of the build directory.
+    
+    The tar stream is piped through pigz (parallel gzip) or gzip when one is
+    installed, so compression runs outside the interpreter and, with pigz,
+    on all cores. A GzipFile is the fallback. tarfile writes the stream in
+    TAR_BUFFER_SIZE blocks instead of its 10 KiB default.
+    
+    Args:
+        build_dir: Directory to archive
+        archive_path: Path of the .tar.gz file to create
+        arcname: Name of the top-level directory inside the archive
+        compress_level: gzip compression level, 1 (fastest) to 9 (smallest)
+    """
+    entries = _archive_entries(build_dir)
+    
+    compressor = shutil.which('pigz') or shutil.which('gzip')
+    if not compressor:
+        with gzip.GzipFile(archive_path, 'wb', compresslevel=compress_level) as gz, \
+                tarfile.open(fileobj=gz, mode='w|', format=tarfile.PAX_FORMAT,
+                             bufsize=TAR_BUFFER_SIZE) as tar:
+            _add_tar_entries(tar, build_dir, arcname, entries)
+        return
+    
+    with open(archive_path, 'wb') as archive_file:
+        process = subprocess.Popen([compressor, '-c', f'-{compress_level}'],
+                                   stdin=subprocess.PIPE, stdout=archive_file)
+        try:
+            with tarfile.open(fileobj=process.stdin, mode='w|', format=tarfile.PAX_FORMAT,
+                              bufsize=TAR_BUFFER_SIZE) as tar:
+                _add_tar_entries(tar, build_dir, arcname, entries)
+        finally:
+            process.stdin.close()
+            returncode = process.wait()
+    
+    if returncode != 0:
+        raise RuntimeError(f"{Path(compressor).name} exited with code {returncode}")
+
+
+def _read_zip_entry(file_path: str, arcname: str) -> Tuple[zipfile.ZipInfo, bytes]:
+    """Read a file and its zip header fields for the zip archive."""
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    with open(file_path, 'rb') as f:
+        return zinfo, f.read()
+
+
+def _write_zip(build_dir: Path, archive_path: Path,
+               compress_level: int = DEFAULT_COMPRESS_LEVEL) -> None:
+    """
+    Write a deflate-compressed zip of the build directory.
+    
+    Files are read ahead on a thread pool and deflated into the archive in
+    name order with ZipFile.writestr. At most ZIP_READ_AHEAD files are held
+    in memory at a time. Deflate runs on the writing thread: ZipFile has no
+    public API for adding already compressed entries, so compressing in
+    parallel would mean writing through its internals.
+    
+    Args:
+        build_dir: Directory to archive
+        archive_path: Path of the .zip file to create
+        compress_level: Deflate compression level, 1 (fastest) to 9 (smallest)
+    """
+    entries = _archive_entries(build_dir)
+    
+    def write_entry(future) -> None:
+        zinfo, data = future.result()
+        zipf.writestr(zinfo, data, compress_type=zipfile.ZIP_DEFLATED,
+                      compresslevel=compress_level)
+    
+    with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf, \
+            ThreadPoolExecutor(max_workers=min(ZIP_READ_AHEAD, os.cpu_count() or 1)) as executor:
+        pending = deque()
+        for entry in entries:
+            pending.append(executor.submit(_read_zip_entry, *entry))
+            if len(pending) >= ZIP_READ_AHEAD:
+                write_entry(pending.popleft())
+        while pending:
+            write_entry(pending.popleft())
+
+
+def create_package_archive(build_dir: Path, output_dir: Path, format: str = "tar.gz",
+                           compress_level: int = DEFAULT_COMPRESS_LEVEL) -> bool:
     """Create package archive."""
     print(f"📦 Creating {format} archive...")
     
@@ -385,15 +736,10 @@ def create_package_archive(build_dir: Path, output_dir: Path, format: str = "tar
     
     try:
         if format == "tar.gz":
-            with tarfile.open(archive_path, "w:gz") as tar:
-                tar.add(build_dir, arcname=f"apple-photos-management-{version}")
+            _write_tar_gz(build_dir, archive_path, f"apple-photos-management-{version}",
+                          compress_level)
         elif format == "zip":
-            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(build_dir):
-                    for file in files:
-                        file_path = Path(root) / file
-                        arcname = file_path.relative_to(build_dir)
-                        zipf.write(file_path, arcname)
+            _write_zip(build_dir, archive_path, compress_level)
         
         print(f"✅ Created archive: {archive_path}")
         return True
@@ -402,24 +748,36 @@ def create_package_archive(build_dir: Path, output_dir: Path, format: str = "tar
         return False
 
 
-def create_checksums(output_dir: Path) -> bool:
+# Checksum algorithms; the checksum file is named checksums.<algorithm>
+CHECKSUM_ALGORITHMS = {'sha256': _file_sha256, 'blake3': _file_blake3}
+DEFAULT_CHECKSUM_ALGORITHM = 'sha256'
+
+
+def create_checksums(output_dir: Path, algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> bool:
     """Create checksums for all files in output directory."""
-    print("🔐 Creating checksums...")
+    print(f"🔐 Creating {algorithm} checksums...")
+    
+    if algorithm == 'blake3' and blake3 is None:
+        print("❌ BLAKE3 checksums need the blake3 package: pip install blake3")
+        return False
     
     try:
-        checksums = {}
+        checksum_file = output_dir / f"checksums.{algorithm}"
+        hash_file = CHECKSUM_ALGORITHMS[algorithm]
         
-        for file_path in output_dir.iterdir():
-            if file_path.is_file():
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                    checksum = hashlib.sha256(content).hexdigest()
-                    checksums[file_path.name] = checksum
+        files = [
+            file_path for file_path in output_dir.iterdir()
+            if file_path.is_file() and not file_path.name.startswith("checksums.")
+        ]
+        
+        # Archives are hashed in parallel, each one streamed from disk
+        with ThreadPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1) or 1) as executor:
+            digests = executor.map(hash_file, map(str, files))
+            checksums = dict(zip((file_path.name for file_path in files), digests))
         
-        checksum_file = output_dir / "checksums.sha256"
         with open(checksum_file, 'w') as f:
             for filename, checksum in checksums.items():
-                f.write(f"{checksum}  {filename}\\n")
+                f.write(f"{checksum}  {filename}\n")
         
         print(f"✅ Created checksums: {checksum_file}")
         return True
@@ -439,6 +797,8 @@ Examples:
   python deploy.py --format zip      # Create ZIP archive
   python deploy.py --no-docker       # Skip Docker files
   python deploy.py --output ./dist   # Custom output directory
+  python deploy.py --clean           # Full rebuild
+  python deploy.py --compress-level 1 # Quick local test archive
         """
     )
     
@@ -456,6 +816,28 @@ Examples:
         help='Archive format (default: tar.gz)'
     )
     
+    parser.add_argument(
+        '--compress-level',
+        type=int,
+        choices=range(1, 10),
+        default=DEFAULT_COMPRESS_LEVEL,
+        metavar='1-9',
+        help=f'Archive compression level, 1 is fastest (default: {DEFAULT_COMPRESS_LEVEL})'
+    )
+    
+    parser.add_argument(
+        '--checksum',
+        choices=sorted(CHECKSUM_ALGORITHMS),
+        default=DEFAULT_CHECKSUM_ALGORITHM,
+        help=f'Checksum algorithm, blake3 needs the blake3 package (default: {DEFAULT_CHECKSUM_ALGORITHM})'
+    )
+    
+    parser.add_argument(
+        '--native-copy',
+        action='store_true',
+        help='Mirror source directories with rsync/robocopy instead of the incremental copy'
+    )
+    
     parser.add_argument(
         '--no-docker',
         action='store_true',
@@ -468,6 +850,12 @@ Examples:
         help='Skip creating archive'
     )
     
+    parser.add_argument(
+        '--clean',
+        action='store_true',
+        help='Remove the previous build instead of updating it incrementally'
+    )
+    
     args = parser.parse_args()
     
     print("🚀 Apple Photos Management Tool Deployment")
@@ -485,37 +873,26 @@ Examples:
         print(f"❌ Failed to create output directory: {e}")
         sys.exit(1)
     
-    # Clean and create build directory
-    if not clean_build_directory(build_dir):
+    # Prepare build directory
+    if not clean_build_directory(build_dir, full=args.clean):
         sys.exit(1)
     
     # Copy source files
-    if not copy_source_files(project_root, build_dir):
+    if not copy_source_files(project_root, build_dir, native_copy=args.native_copy):
         sys.exit(1)
     
-    # Create launcher scripts
-    if not create_launcher_scripts(build_dir):
+    # Create launcher, installer and Docker files
+    if not create_build_files(build_dir, include_docker=not args.no_docker):
         sys.exit(1)
     
-    # Create installer script
-    if not create_installer_script(build_dir):
-        sys.exit(1)
-    
-    # Create Docker files
-    if not args.no_docker:
-        if not create_dockerfile(build_dir):
-            sys.exit(1)
-        
-        if not create_docker_compose(build_dir):
-            sys.exit(1)
-    
     # Create package archive
     if not args.no_archive:
-        if not create_package_archive(build_dir, args.output, args.format):
+        if not create_package_archive(build_dir, args.output, args.format,
+                                      args.compress_level):
             sys.exit(1)
     
     # Create checksums
-    if not create_checksums(args.output):
+    if not create_checksums(args.output, args.checksum):
         sys.exit(1)
     
     # Print deployment summary
@@ -12,43 +12,15 @@ License: MIT
 
 import argparse
 import os
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
 
+# Add project root to path for the shared script helpers
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
 
-def run_command(command: List[str], cwd: Optional[Path] = None) -> bool:
-    """
-    Run a command and return success status.
-    
-    Args:
-        command: Command to run as list of strings
-        cwd: Working directory for the command
-        
-    Returns:
-        True if command succeeded, False otherwise
-    """
-    try:
-        result = subprocess.run(
-            command,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        print(f"✅ {command[0]} completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {command[0]} failed: {e}")
-        if e.stdout:
-            print(f"STDOUT: {e.stdout}")
-        if e.stderr:
-            print(f"STDERR: {e.stderr}")
-        return False
-    except FileNotFoundError:
-        print(f"❌ Command not found: {command[0]}")
-        return False
+from scripts._common import run_command, write_files
 
 
 def check_python_version() -> bool:
@@ -76,7 +48,7 @@ def check_pip() -> bool:
         return False
 
 
-def create_virtual_environment(venv_path: Path) -> bool:
+def create_virtual_environment(venv_path: Path, verbose: bool = False) -> bool:
     """Create virtual environment."""
     print(f"🔧 Creating virtual environment at {venv_path}...")
     
@@ -84,7 +56,7 @@ def create_virtual_environment(venv_path: Path) -> bool:
         print(f"⚠️  Virtual environment already exists at {venv_path}")
         return True
     
-    return run_command([sys.executable, "-m", "venv", str(venv_path)])
+    return run_command([sys.executable, "-m", "venv", str(venv_path)], verbose=verbose)
 
 
 def activate_virtual_environment(venv_path: Path) -> str:
@@ -95,27 +67,28 @@ def activate_virtual_environment(venv_path: Path) -> str:
         return f"source {venv_path / 'bin' / 'activate'}"
 
 
-def install_dependencies(venv_path: Path) -> bool:
+def install_dependencies(venv_path: Path, verbose: bool = False) -> bool:
     """Install Python dependencies."""
     print("📚 Installing dependencies...")
     
-    # Determine pip path
+    # Determine python path, pip runs as a module so it can upgrade itself
     if os.name == 'nt':  # Windows
-        pip_path = venv_path / "Scripts" / "pip"
+        python_path = venv_path / "Scripts" / "python"
     else:  # Unix-like
-        pip_path = venv_path / "bin" / "pip"
-    
-    # Upgrade pip first
-    if not run_command([str(pip_path), "install", "--upgrade", "pip"]):
-        return False
+        python_path = venv_path / "bin" / "python"
     
-    # Install requirements
     requirements_file = Path(__file__).parent.parent / "requirements.txt"
     if not requirements_file.exists():
         print(f"❌ Requirements file not found: {requirements_file}")
         return False
     
-    return run_command([str(pip_path), "install", "-r", str(requirements_file)])
+    # Upgrade pip and install requirements in a single pip process; wheels
+    # are preferred over building sdists and byte-compiling is left to the
+    # first import
+    return run_command([
+        str(python_path), "-m", "pip", "install", "--upgrade", "--prefer-binary",
+        "--no-compile", "pip", "-r", str(requirements_file)
+    ], verbose=verbose)
 
 
 def create_env_file(project_root: Path) -> bool:
@@ -156,15 +129,18 @@ def create_directories(project_root: Path) -> bool:
         "temp"
     ]
     
-    for directory in directories:
-        dir_path = project_root / directory
-        try:
-            dir_path.mkdir(parents=True, exist_ok=True)
-            print(f"✅ Created directory: {directory}")
-        except Exception as e:
-            print(f"❌ Failed to create directory {directory}: {e}")
-            return False
+    # mkdir calls are issued concurrently, which helps on network filesystems
+    try:
+        with ThreadPoolExecutor(max_workers=len(directories)) as executor:
+            list(executor.map(
+                lambda directory: (project_root / directory).mkdir(parents=True, exist_ok=True),
+                directories
+            ))
+    except Exception as e:
+        print(f"❌ Failed to create project directories: {e}")
+        return False
     
+    print(f"✅ Created directories: {', '.join(directories)}")
     return True
 
 
@@ -180,56 +156,45 @@ def run_tests(venv_path: Path) -> bool:
     
     project_root = Path(__file__).parent.parent
     
+    # pytest reports failures on stdout, so its output is always shown
     return run_command([
         str(python_path), "-m", "pytest", "tests/", "-v", "--tb=short"
-    ], cwd=project_root)
+    ], cwd=project_root, verbose=True)
 
 
-def create_launcher_scripts(project_root: Path, venv_path: Path) -> bool:
-    """Create launcher scripts for different platforms."""
-    print("🚀 Creating launcher scripts...")
-    
-    # Get activation command
-    activation_cmd = activate_virtual_environment(venv_path)
-    
-    # Create shell script for Unix-like systems
-    shell_script = project_root / "run.sh"
-    try:
-        with open(shell_script, 'w') as f:
-            f.write(f"""#!/bin/bash
+# Launcher templates, formatted with the venv activation command or script
+UNIX_LAUNCHER = """#!/bin/bash
 # Apple Photos Management Tool Launcher
 
 # Activate virtual environment
-{activation_cmd}
+{activation}
 
 # Run the application
 python main.py "$@"
-""")
-        shell_script.chmod(0o755)
-        print(f"✅ Created launcher script: {shell_script}")
-    except Exception as e:
-        print(f"❌ Failed to create shell launcher: {e}")
-        return False
-    
-    # Create batch script for Windows
-    batch_script = project_root / "run.bat"
-    try:
-        with open(batch_script, 'w') as f:
-            f.write(f"""@echo off
+"""
+
+WINDOWS_LAUNCHER = """@echo off
 REM Apple Photos Management Tool Launcher
 
 REM Activate virtual environment
-call {venv_path / "Scripts" / "activate.bat"}
+call {activation}
 
 REM Run the application
 python main.py %*
-""")
-        print(f"✅ Created launcher script: {batch_script}")
-    except Exception as e:
-        print(f"❌ Failed to create batch launcher: {e}")
-        return False
+"""
+
+
+def create_launcher_scripts(project_root: Path, venv_path: Path) -> bool:
+    """Create launcher scripts for different platforms."""
+    print("🚀 Creating launcher scripts...")
     
-    return True
+    # (path, mode or None to keep the default, content)
+    return write_files([
+        (project_root / "run.sh", 0o755,
+         UNIX_LAUNCHER.format(activation=activate_virtual_environment(venv_path))),
+        (project_root / "run.bat", None,
+         WINDOWS_LAUNCHER.format(activation=venv_path / "Scripts" / "activate.bat")),
+    ])
 
 
 def print_setup_summary(project_root: Path, venv_path: Path):
@@ -288,6 +253,12 @@ Examples:
         help='Skip dependency installation'
     )
     
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Show the output of venv creation and pip'
+    )
+    
     args = parser.parse_args()
     
     print("🚀 Apple Photos Management Tool Setup")
@@ -304,12 +275,12 @@ Examples:
         sys.exit(1)
     
     # Create virtual environment
-    if not create_virtual_environment(args.venv_path):
+    if not create_virtual_environment(args.venv_path, verbose=args.verbose):
         sys.exit(1)
     
     # Install dependencies
     if not args.no_deps:
-        if not install_dependencies(args.venv_path):
+        if not install_dependencies(args.venv_path, verbose=args.verbose):
             sys.exit(1)
     
     # Create project structure
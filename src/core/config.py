@@ -5,49 +5,100 @@ This module provides a single source of truth for all configuration values,
 replacing hardcoded values scattered throughout the codebase.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Set, Dict, Any, Optional
+from typing import Callable, ClassVar, FrozenSet, Dict, Any, Optional, Tuple
 import os
+import sys
 
 
-@dataclass
+# Configuration is read-only once loaded; slots are only available on 3.10+
+_DATACLASS_OPTIONS = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS['slots'] = True
+
+# Immutable defaults, shared by every configuration instance
+_IMAGE_FORMATS = frozenset({
+    '.heic', '.jpg', '.jpeg', '.png', '.tiff', '.tif', 
+    '.raw', '.cr2', '.nef', '.arw'
+})
+
+_VIDEO_FORMATS = frozenset({
+    '.mov', '.mp4', '.avi', '.mkv', '.m4v'
+})
+
+_METADATA_FORMATS = frozenset({
+    '.aae'  # Apple Adjustment Export files
+})
+
+_SIDECAR_FORMATS = frozenset({
+    '.xmp'  # Extensible Metadata Platform
+})
+
+_AVAILABLE_LOG_LEVELS = frozenset({
+    'DEBUG', 'INFO', 'WARNING', 'ERROR'
+})
+
+_ALLOWED_USER_DIRECTORIES = frozenset({
+    'Downloads', 'Pictures', 'Desktop', 'Documents', 
+    'Movies', 'Music', 'Public'
+})
+
+_SUSPICIOUS_PATTERNS = frozenset({
+    '..', '//', '\\\\', '~', '$', '`', '|', '&', ';', 
+    '(', ')', '<', '>', '"', "'", '\\n', '\\r', '\\t',
+    '\\x00', '\\x01', '\\x02', '\\x03', '\\x04', '\\x05', 
+    '\\x06', '\\x07', '\\x08', '\\x0b', '\\x0c', '\\x0e', 
+    '\\x0f', '\\x10', '\\x11', '\\x12', '\\x13', '\\x14', 
+    '\\x15', '\\x16', '\\x17', '\\x18', '\\x19', '\\x1a', 
+    '\\x1b', '\\x1c', '\\x1d', '\\x1e', '\\x1f'
+})
+
+_AVAILABLE_STRATEGIES = frozenset({
+    'keep_first', 'skip_duplicates', 'preserve_duplicates', 
+    'cleanup_duplicates', '!delete!'
+})
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FileFormats:
     """Supported file formats configuration."""
     
     # Image formats
-    IMAGE_FORMATS: Set[str] = field(default_factory=lambda: {
-        '.heic', '.jpg', '.jpeg', '.png', '.tiff', '.tif', 
-        '.raw', '.cr2', '.nef', '.arw'
-    })
+    IMAGE_FORMATS: FrozenSet[str] = _IMAGE_FORMATS
     
     # Video formats
-    VIDEO_FORMATS: Set[str] = field(default_factory=lambda: {
-        '.mov', '.mp4', '.avi', '.mkv', '.m4v'
-    })
+    VIDEO_FORMATS: FrozenSet[str] = _VIDEO_FORMATS
     
     # Metadata formats
-    METADATA_FORMATS: Set[str] = field(default_factory=lambda: {
-        '.aae'  # Apple Adjustment Export files
-    })
+    METADATA_FORMATS: FrozenSet[str] = _METADATA_FORMATS
     
     # Sidecar formats
-    SIDECAR_FORMATS: Set[str] = field(default_factory=lambda: {
-        '.xmp'  # Extensible Metadata Platform
-    })
+    SIDECAR_FORMATS: FrozenSet[str] = _SIDECAR_FORMATS
+    
+    # Combined sets, computed once in __post_init__
+    _all_supported_formats: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _processable_formats: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompute the combined format sets."""
+        processable = frozenset(self.IMAGE_FORMATS | self.VIDEO_FORMATS)
+        object.__setattr__(self, '_processable_formats', processable)
+        object.__setattr__(self, '_all_supported_formats', processable | self.METADATA_FORMATS)
     
     @property
-    def ALL_SUPPORTED_FORMATS(self) -> Set[str]:
+    def ALL_SUPPORTED_FORMATS(self) -> FrozenSet[str]:
         """All supported formats combined."""
-        return self.IMAGE_FORMATS | self.VIDEO_FORMATS | self.METADATA_FORMATS
+        return self._all_supported_formats
     
     @property
-    def PROCESSABLE_FORMATS(self) -> Set[str]:
+    def PROCESSABLE_FORMATS(self) -> FrozenSet[str]:
         """Formats that can be processed (images + videos)."""
-        return self.IMAGE_FORMATS | self.VIDEO_FORMATS
+        return self._processable_formats
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessingConfig:
     """Processing-related configuration."""
     
@@ -72,10 +123,22 @@ class ProcessingConfig:
     
     # File operations
     CHUNK_SIZE: int = 8192  # For file hashing and copying
+    DUPLICATE_SAMPLE_SIZE: int = 65536  # Bytes hashed from file head/tail for duplicate pre-check
+    DUPLICATE_LARGE_FILE_SIZE: int = 100 * 1024 * 1024  # Files above this also sample their middle
+    DUPLICATE_HASH_ALGORITHM: str = 'auto'  # 'auto' uses xxh3/BLAKE3 when installed, 'sha256' forces hashlib
+    DUPLICATE_MMAP_THRESHOLD: int = 1024 * 1024  # Files above this are memory-mapped for full hashing
     MAX_FILENAME_LENGTH: int = 255
+    
+    # Bulk EXIF extraction (used when exiftool is on PATH)
+    EXIFTOOL_MIN_FILES: int = 200  # Below this, starting exiftool costs more than it saves
+    EXIFTOOL_BATCH_SIZE: int = 1000  # Files per -execute request
+    
+    # EXIF dates cached between runs (SQLite), off unless a path is set,
+    # e.g. PHOTO_EXPORT_METADATA_CACHE=~/.cache/apple-photos-mgmt/meta.sqlite
+    METADATA_CACHE_FILE: str = ''
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DateFormats:
     """Date and time formatting configuration."""
     
@@ -92,7 +155,7 @@ class DateFormats:
     EXPORT_DIR_TIMESTAMP: str = '%Y%m%d-%H%M%S'
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SystemConfig:
     """System resource configuration."""
     
@@ -112,15 +175,13 @@ class SystemConfig:
     METRICS_RETENTION: int = 1000  # Number of metrics to keep in memory
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LoggingConfig:
     """Logging configuration."""
     
     # Log levels
     DEFAULT_LOG_LEVEL: str = 'INFO'
-    AVAILABLE_LOG_LEVELS: Set[str] = field(default_factory=lambda: {
-        'DEBUG', 'INFO', 'WARNING', 'ERROR'
-    })
+    AVAILABLE_LOG_LEVELS: FrozenSet[str] = _AVAILABLE_LOG_LEVELS
     
     # Log formatting
     CONSOLE_FORMAT: str = "<level>{level: <8}</level> | <level>{message}</level>"
@@ -133,46 +194,32 @@ class LoggingConfig:
     LOG_COMPRESSION: Optional[str] = None  # Disabled for consistency
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SecurityConfig:
     """Security-related configuration."""
     
     # Path validation
-    ALLOWED_USER_DIRECTORIES: Set[str] = field(default_factory=lambda: {
-        'Downloads', 'Pictures', 'Desktop', 'Documents', 
-        'Movies', 'Music', 'Public'
-    })
+    ALLOWED_USER_DIRECTORIES: FrozenSet[str] = _ALLOWED_USER_DIRECTORIES
     
     # Filename sanitization
     MAX_FILENAME_LENGTH: int = 255
-    SUSPICIOUS_PATTERNS: Set[str] = field(default_factory=lambda: {
-        '..', '//', '\\\\', '~', '$', '`', '|', '&', ';', 
-        '(', ')', '<', '>', '"', "'", '\\n', '\\r', '\\t',
-        '\\x00', '\\x01', '\\x02', '\\x03', '\\x04', '\\x05', 
-        '\\x06', '\\x07', '\\x08', '\\x0b', '\\x0c', '\\x0e', 
-        '\\x0f', '\\x10', '\\x11', '\\x12', '\\x13', '\\x14', 
-        '\\x15', '\\x16', '\\x17', '\\x18', '\\x19', '\\x1a', 
-        '\\x1b', '\\x1c', '\\x1d', '\\x1e', '\\x1f'
-    })
-
-
-@dataclass
+    SUSPICIOUS_PATTERNS: FrozenSet[str] = _SUSPICIOUS_PATTERNS
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class DuplicateConfig:
     """Duplicate handling configuration."""
     
     # Duplicate strategies
     DEFAULT_STRATEGY: str = 'keep_first'
-    AVAILABLE_STRATEGIES: Set[str] = field(default_factory=lambda: {
-        'keep_first', 'skip_duplicates', 'preserve_duplicates', 
-        'cleanup_duplicates', '!delete!'
-    })
+    AVAILABLE_STRATEGIES: FrozenSet[str] = _AVAILABLE_STRATEGIES
     
     # Duplicate preservation limits
     MAX_DUPLICATES_TO_PRESERVE: int = 2  # Keep original + 1 duplicate
     DUPLICATES_CLEANUP_THRESHOLD: int = 1000  # Cleanup if more than N duplicates
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AppConfig:
     """Main application configuration."""
     
@@ -202,29 +249,52 @@ class AppConfig:
     # Duplicates
     duplicates: DuplicateConfig = field(default_factory=DuplicateConfig)
     
+    # Clamped (workers, batch size) of already validated section combinations,
+    # so unchanged reloads skip the checks
+    _validated: ClassVar[Dict[Tuple[Any, ...], Tuple[int, int]]] = {}
+    
     def __post_init__(self):
         """Validate configuration after initialization."""
         self._validate_config()
     
     def _validate_config(self):
         """Validate configuration values."""
+        processing = self.processing
+        signature = (processing, self.logging, self.duplicates)
+        clamped = self._validated.get(signature)
+        
+        if clamped is None:
+            clamped = self._check_sections()
+            self._validated[signature] = clamped
+        
+        # Config is frozen, so clamped values go into a replacement section
+        workers, batch_size = clamped
+        if (workers, batch_size) != (processing.DEFAULT_WORKERS, processing.DEFAULT_BATCH_SIZE):
+            object.__setattr__(self, 'processing', replace(
+                processing, DEFAULT_WORKERS=workers, DEFAULT_BATCH_SIZE=batch_size))
+    
+    def _check_sections(self) -> Tuple[int, int]:
+        """
+        Check the processing, logging and duplicate sections.
+        
+        Returns:
+            Tuple of (workers, batch size) clamped to their allowed ranges
+        """
+        processing = self.processing
+        
         # Validate worker counts
-        if self.processing.MIN_WORKERS > self.processing.MAX_WORKERS:
+        if processing.MIN_WORKERS > processing.MAX_WORKERS:
             raise ValueError("MIN_WORKERS cannot be greater than MAX_WORKERS")
         
-        if self.processing.DEFAULT_WORKERS < self.processing.MIN_WORKERS:
-            self.processing.DEFAULT_WORKERS = self.processing.MIN_WORKERS
-        elif self.processing.DEFAULT_WORKERS > self.processing.MAX_WORKERS:
-            self.processing.DEFAULT_WORKERS = self.processing.MAX_WORKERS
+        workers = min(max(processing.DEFAULT_WORKERS, processing.MIN_WORKERS),
+                      processing.MAX_WORKERS)
         
         # Validate batch sizes
-        if self.processing.MIN_BATCH_SIZE > self.processing.MAX_BATCH_SIZE:
+        if processing.MIN_BATCH_SIZE > processing.MAX_BATCH_SIZE:
             raise ValueError("MIN_BATCH_SIZE cannot be greater than MAX_BATCH_SIZE")
         
-        if self.processing.DEFAULT_BATCH_SIZE < self.processing.MIN_BATCH_SIZE:
-            self.processing.DEFAULT_BATCH_SIZE = self.processing.MIN_BATCH_SIZE
-        elif self.processing.DEFAULT_BATCH_SIZE > self.processing.MAX_BATCH_SIZE:
-            self.processing.DEFAULT_BATCH_SIZE = self.processing.MAX_BATCH_SIZE
+        batch_size = min(max(processing.DEFAULT_BATCH_SIZE, processing.MIN_BATCH_SIZE),
+                         processing.MAX_BATCH_SIZE)
         
         # Validate log level
         if self.logging.DEFAULT_LOG_LEVEL not in self.logging.AVAILABLE_LOG_LEVELS:
@@ -233,42 +303,55 @@ class AppConfig:
         # Validate duplicate strategy
         if self.duplicates.DEFAULT_STRATEGY not in self.duplicates.AVAILABLE_STRATEGIES:
             raise ValueError(f"Invalid duplicate strategy: {self.duplicates.DEFAULT_STRATEGY}")
+        
+        return workers, batch_size
     
     @classmethod
     def from_env(cls) -> 'AppConfig':
         """Create configuration from environment variables."""
-        config = cls()
-        
-        # Override with environment variables if present
-        if os.getenv('PHOTO_EXPORT_WORKERS'):
-            config.processing.DEFAULT_WORKERS = int(os.getenv('PHOTO_EXPORT_WORKERS'))
-        
-        if os.getenv('PHOTO_EXPORT_BATCH_SIZE'):
-            config.processing.DEFAULT_BATCH_SIZE = int(os.getenv('PHOTO_EXPORT_BATCH_SIZE'))
-        
-        if os.getenv('PHOTO_EXPORT_CACHE_SIZE'):
-            config.processing.DEFAULT_CACHE_SIZE = int(os.getenv('PHOTO_EXPORT_CACHE_SIZE'))
+        overrides: Dict[str, Dict[str, Any]] = {
+            'processing': {}, 'logging': {}, 'duplicates': {}
+        }
         
-        if os.getenv('PHOTO_EXPORT_LOG_LEVEL'):
-            config.logging.DEFAULT_LOG_LEVEL = os.getenv('PHOTO_EXPORT_LOG_LEVEL').upper()
+        # Override with environment variables if present, reading each one once
+        env = os.environ
+        for var, section, name, convert in _ENV_SPEC:
+            value = env.get(var)
+            if value:
+                overrides[section][name] = convert(value)
         
-        if os.getenv('PHOTO_EXPORT_DUPLICATE_STRATEGY'):
-            config.duplicates.DEFAULT_STRATEGY = os.getenv('PHOTO_EXPORT_DUPLICATE_STRATEGY')
-        
-        return config
+        return cls(
+            processing=ProcessingConfig(**overrides['processing']),
+            logging=LoggingConfig(**overrides['logging']),
+            duplicates=DuplicateConfig(**overrides['duplicates']),
+        )
 
 
-# Global configuration instance
-config = AppConfig.from_env()
+# Environment variable -> (config section, field, converter) overrides
+_ENV_SPEC: Tuple[Tuple[str, str, str, Callable[[str], Any]], ...] = (
+    ('PHOTO_EXPORT_WORKERS', 'processing', 'DEFAULT_WORKERS', int),
+    ('PHOTO_EXPORT_BATCH_SIZE', 'processing', 'DEFAULT_BATCH_SIZE', int),
+    ('PHOTO_EXPORT_CACHE_SIZE', 'processing', 'DEFAULT_CACHE_SIZE', int),
+    ('PHOTO_EXPORT_METADATA_CACHE', 'processing', 'METADATA_CACHE_FILE', str),
+    ('PHOTO_EXPORT_LOG_LEVEL', 'logging', 'DEFAULT_LOG_LEVEL', str.upper),
+    ('PHOTO_EXPORT_DUPLICATE_STRATEGY', 'duplicates', 'DEFAULT_STRATEGY', str),
+)
 
 
+@lru_cache(maxsize=None)
 def get_config() -> AppConfig:
-    """Get the global configuration instance."""
-    return config
+    """Get the global configuration instance, loaded once on first use."""
+    return AppConfig.from_env()
+
+
+def __getattr__(name: str) -> Any:
+    """Build the ``config`` module attribute lazily on first access (PEP 562)."""
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def reload_config() -> AppConfig:
     """Reload configuration from environment variables."""
-    global config
-    config = AppConfig.from_env()
-    return config
+    get_config.cache_clear()
+    return get_config()
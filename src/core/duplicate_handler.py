@@ -7,18 +7,37 @@ for photo and video files during the export process.
 """
 
 import hashlib
+import mmap
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the project root to the Python path
 import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.logging.logger_config import log_info, log_warning, log_debug, log_error
+from src.logging.logger_config import log_info, log_warning, log_debug, log_error, is_debug_enabled
 from src.core.config import get_config
 
+# Optional fast hashers for full-file duplicate checks, SHA-256 is used when
+# neither is installed
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Duplicate groups are keyed by (content hash or filename, file type category)
+DuplicateKey = Tuple[str, str]
+
 
 @dataclass
 class DuplicateStats:
@@ -52,57 +71,200 @@ class DuplicateHandler:
         self.duplicate_strategy = duplicate_strategy
         self.stats = DuplicateStats()
         self.config = get_config()
-        self.duplicates_to_preserve: Dict[str, List[Path]] = {}
+        self.duplicates_to_preserve: Dict[DuplicateKey, List[Path]] = {}
+        self._new_hasher = self._select_hasher()
+        self._strategy_handlers: Dict[str, Callable[[Dict[DuplicateKey, List[Path]]], List[Path]]] = {
+            'keep_first': self._handle_keep_first,
+            'skip_duplicates': self._handle_skip_duplicates,
+            'preserve_duplicates': self._handle_preserve_duplicates,
+            'cleanup_duplicates': self._handle_cleanup_duplicates,
+            '!delete!': self._handle_delete_duplicates,
+        }
+        # Extension -> category lookup, built once instead of probing the
+        # config format sets for every file
+        self._ext_to_category: Dict[str, str] = {
+            **{ext: "video" for ext in self.config.file_formats.VIDEO_FORMATS},
+            **{ext: "image" for ext in self.config.file_formats.IMAGE_FORMATS},
+        }
         
-    def detect_duplicates(self, photo_files: List[Path]) -> Dict[str, List[Path]]:
+    def detect_duplicates(self, photo_files: List[Path],
+                          file_sizes: Optional[Dict[Path, int]] = None) -> Dict[DuplicateKey, List[Path]]:
         """
         Detect duplicate files based on file content (hash) and file type.
         
+        Files are first grouped by size and file type, which needs only a
+        stat. Files sharing a size are then grouped by a hash of their first
+        and last bytes, and only files sharing that sample key are hashed in
+        full, so files of a unique size are never opened at all.
+        
         Args:
             photo_files: List of photo file paths to check for duplicates
+            file_sizes: Sizes already known from scanning, to skip the stat
             
         Returns:
             Dictionary mapping composite keys to lists of duplicate file paths
         """
-        seen_files = {}
-        duplicates = {}
+        groups: Dict[DuplicateKey, List[Path]] = defaultdict(list)
+        size_buckets: Dict[Tuple[int, str], List[Path]] = defaultdict(list)
+        candidates: Dict[Tuple[Tuple[int, bytes], str], List[Path]] = defaultdict(list)
+
+        # Bound lookups hoisted out of the per-file loops
+        category_of = self._ext_to_category.get
+        register_by_filename = self._register_by_filename
+        calculate_sample_key = self._calculate_sample_key
 
         for photo_path in photo_files:
+            # Get file type (extension) for better duplicate detection; the
+            # name is taken once and the extension split off as a plain str
+            name = photo_path.name
+            file_type = category_of(os.path.splitext(name)[1].lower(), "other")
             try:
-                # Calculate file hash
-                with open(photo_path, 'rb') as f:
-                    file_hash = hashlib.md5(f.read()).hexdigest()
-                
-                # Get file type (extension) for better duplicate detection
-                file_extension = photo_path.suffix.lower()
-                file_type = self._get_file_type_category(file_extension)
-                
-                # Create a composite key: hash + file_type
-                # This ensures that MOV and HEIC files with same content are treated as different
-                composite_key = f"{file_hash}_{file_type}"
-                
-                if composite_key in seen_files:
-                    if composite_key not in duplicates:
-                        duplicates[composite_key] = [seen_files[composite_key]]
-                    duplicates[composite_key].append(photo_path)
+                if file_sizes is not None and photo_path in file_sizes:
+                    file_size = file_sizes[photo_path]
                 else:
-                    seen_files[composite_key] = photo_path
+                    file_size = photo_path.stat().st_size
+                size_buckets[(file_size, file_type)].append(photo_path)
             except Exception as e:
                 log_warning(f"Could not calculate hash for {photo_path}: {e}")
-                # Fallback to filename-based detection with file type consideration
-                filename = photo_path.name
-                file_extension = photo_path.suffix.lower()
-                file_type = self._get_file_type_category(file_extension)
-                composite_filename = f"{filename}_{file_type}"
-                
-                if composite_filename in seen_files:
-                    if composite_filename not in duplicates:
-                        duplicates[composite_filename] = [seen_files[composite_filename]]
-                    duplicates[composite_filename].append(photo_path)
-                else:
-                    seen_files[composite_filename] = photo_path
+                register_by_filename(name, file_type, groups, photo_path)
+
+        for (file_size, file_type), paths in size_buckets.items():
+            if len(paths) < 2:
+                continue  # Unique size - cannot be a duplicate
 
-        return duplicates
+            for photo_path in paths:
+                try:
+                    candidates[(calculate_sample_key(photo_path, file_size), file_type)].append(photo_path)
+                except Exception as e:
+                    log_warning(f"Could not calculate hash for {photo_path}: {e}")
+                    register_by_filename(photo_path.name, file_type, groups, photo_path)
+
+        # Files with a unique size and sample cannot be duplicates
+        hash_jobs = [
+            (photo_path, file_type)
+            for (sample_key, file_type), paths in candidates.items() if len(paths) > 1
+            for photo_path in paths
+        ]
+
+        # Full hashing is I/O bound and hashlib releases the GIL, so larger
+        # candidate sets are hashed on a thread pool; map keeps input order
+        processing = self.config.processing
+        if len(hash_jobs) < processing.MEMORY_OPTIMIZATION_THRESHOLD:
+            hash_results = map(self._hash_one, hash_jobs)
+        else:
+            with ThreadPoolExecutor(max_workers=processing.DEFAULT_WORKERS) as executor:
+                hash_results = list(executor.map(self._hash_one, hash_jobs))
+
+        for photo_path, file_type, composite_key in hash_results:
+            if composite_key is None:
+                register_by_filename(photo_path.name, file_type, groups, photo_path)
+            else:
+                groups[composite_key].append(photo_path)
+
+        return {key: paths for key, paths in groups.items() if len(paths) > 1}
+
+    def _hash_one(self, job: Tuple[Path, str]) -> Tuple[Path, str, Optional[DuplicateKey]]:
+        """
+        Calculate the composite duplicate key of a single file.
+        
+        Args:
+            job: Tuple of (file path, file type category)
+            
+        Returns:
+            Tuple of (file path, file type, composite key or None if hashing failed)
+        """
+        photo_path, file_type = job
+        try:
+            # Create a composite key: hash + file_type
+            # This ensures that MOV and HEIC files with same content are treated as different
+            return photo_path, file_type, (self._calculate_file_hash(photo_path), file_type)
+        except Exception as e:
+            log_warning(f"Could not calculate hash for {photo_path}: {e}")
+            return photo_path, file_type, None
+
+    def _register_by_filename(self, name: str, file_type: str,
+                              groups: Dict[DuplicateKey, List[Path]], photo_path: Path):
+        """Fallback to filename-based detection with file type consideration."""
+        groups[(name, file_type)].append(photo_path)
+
+    def _calculate_sample_key(self, file_path: Path, file_size: int) -> Tuple[int, bytes]:
+        """
+        Calculate a cheap content key from file size and its first/last bytes.
+        
+        Large files (typically videos) also contribute a block from their
+        middle, so that files differing only in their payload rarely reach
+        the full-file hash.
+        
+        Args:
+            file_path: Path to the file
+            file_size: File size from the earlier stat
+            
+        Returns:
+            Tuple of (file size, BLAKE2b digest of the sampled bytes)
+        """
+        sample_size = self.config.processing.DUPLICATE_SAMPLE_SIZE
+        with open(file_path, 'rb') as f:
+            sample = f.read(sample_size)
+            if file_size > self.config.processing.DUPLICATE_LARGE_FILE_SIZE:
+                f.seek((file_size - sample_size) // 2)
+                sample += f.read(sample_size)
+            if file_size > sample_size:
+                f.seek(max(file_size - sample_size, sample_size))
+                sample += f.read(sample_size)
+        return file_size, hashlib.blake2b(sample, digest_size=16).digest()
+
+    def _select_hasher(self) -> Callable[[], Any]:
+        """
+        Select the hash constructor used for full-file duplicate checks.
+        
+        Duplicate detection needs no cryptographic strength, so with the
+        'auto' setting the SIMD-accelerated xxh3-128 or BLAKE3 is preferred
+        when installed.
+        
+        Returns:
+            Callable returning a new hash object
+        """
+        if self.config.processing.DUPLICATE_HASH_ALGORITHM == 'auto':
+            if xxhash is not None:
+                return xxhash.xxh3_128
+            if blake3 is not None:
+                return blake3.blake3
+        return hashlib.sha256
+
+    def _calculate_file_hash(self, file_path: Path) -> str:
+        """
+        Hash the whole file without loading it into memory.
+        
+        Larger files are memory-mapped and hashed with a single update call,
+        avoiding a Python read loop and a copy per chunk. Mapping can fail on
+        some network filesystems, in which case the file is read in chunks.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Hex digest of the file content
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > self.config.processing.DUPLICATE_MMAP_THRESHOLD:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                            mapped.madvise(mmap.MADV_SEQUENTIAL)
+                        hasher = self._new_hasher()
+                        hasher.update(mapped)
+                        return hasher.hexdigest()
+                except (OSError, ValueError):
+                    pass
+            
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                return hashlib.file_digest(f, self._new_hasher).hexdigest()
+            
+            hasher = self._new_hasher()
+            chunk_size = self.config.processing.CHUNK_SIZE
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                hasher.update(chunk)
+            return hasher.hexdigest()
 
     def _get_file_type_category(self, extension: str) -> str:
         """
@@ -114,14 +276,9 @@ class DuplicateHandler:
         Returns:
             File type category ('image', 'video', or 'other')
         """
-        if extension in self.config.file_formats.IMAGE_FORMATS:
-            return "image"
-        elif extension in self.config.file_formats.VIDEO_FORMATS:
-            return "video"
-        else:
-            return "other"
+        return self._ext_to_category.get(extension, "other")
 
-    def handle_duplicates(self, duplicates: Dict[str, List[Path]]) -> List[Path]:
+    def handle_duplicates(self, duplicates: Dict[DuplicateKey, List[Path]]) -> List[Path]:
         """
         Handle duplicates based on the configured strategy.
         
@@ -137,70 +294,72 @@ class DuplicateHandler:
         self.stats.duplicate_files_found = len(duplicates)
         log_info(f"Found {len(duplicates)} duplicate files")
         
-        if self.duplicate_strategy == 'keep_first':
-            return self._handle_keep_first(duplicates)
-        elif self.duplicate_strategy == 'skip_duplicates':
-            return self._handle_skip_duplicates(duplicates)
-        elif self.duplicate_strategy == 'preserve_duplicates':
-            return self._handle_preserve_duplicates(duplicates)
-        elif self.duplicate_strategy == 'cleanup_duplicates':
-            return self._handle_cleanup_duplicates(duplicates)
-        elif self.duplicate_strategy == '!delete!':
-            return self._handle_delete_duplicates(duplicates)
-        else:
+        handler = self._strategy_handlers.get(self.duplicate_strategy)
+        if handler is None:
             # Default: keep first
             log_warning(f"Unknown duplicate strategy '{self.duplicate_strategy}', using 'keep_first'")
             self.duplicate_strategy = 'keep_first'
-            return self._handle_keep_first(duplicates)
+            handler = self._handle_keep_first
+        return handler(duplicates)
 
-    def _handle_keep_first(self, duplicates: Dict[str, List[Path]]) -> List[Path]:
+    def _handle_keep_first(self, duplicates: Dict[DuplicateKey, List[Path]]) -> List[Path]:
         """Keep only the first occurrence of each duplicate."""
-        resolved_files = []
-        for filename, paths in duplicates.items():
-            resolved_files.append(paths[0])
-            self.stats.duplicate_files_resolved += len(paths) - 1
-            log_debug(f"Duplicate '{filename}': keeping first occurrence, skipping {len(paths) - 1} duplicates")
+        resolved_files = [paths[0] for paths in duplicates.values()]
+        self.stats.duplicate_files_resolved += sum(len(paths) - 1 for paths in duplicates.values())
+        if is_debug_enabled():
+            for (name, file_type), paths in duplicates.items():
+                log_debug(f"Duplicate '{name}_{file_type}': keeping first occurrence, skipping {len(paths) - 1} duplicates")
         return resolved_files
 
-    def _handle_skip_duplicates(self, duplicates: Dict[str, List[Path]]) -> List[Path]:
+    def _handle_skip_duplicates(self, duplicates: Dict[DuplicateKey, List[Path]]) -> List[Path]:
         """Skip all files that have duplicates."""
-        for filename, paths in duplicates.items():
-            self.stats.files_skipped_duplicates += len(paths)
-            log_debug(f"Duplicate '{filename}': skipping all {len(paths)} occurrences")
+        debug = is_debug_enabled()
+        skipped = 0
+        for (name, file_type), paths in duplicates.items():
+            skipped += len(paths)
+            if debug:
+                log_debug(f"Duplicate '{name}_{file_type}': skipping all {len(paths)} occurrences")
+        self.stats.files_skipped_duplicates += skipped
         return []
 
-    def _handle_preserve_duplicates(self, duplicates: Dict[str, List[Path]]) -> List[Path]:
+    def _handle_preserve_duplicates(self, duplicates: Dict[DuplicateKey, List[Path]]) -> List[Path]:
         """Keep first occurrence for main export, preserve others in duplicates folder."""
-        resolved_files = []
-        for filename, paths in duplicates.items():
-            # Keep first occurrence for main export
-            resolved_files.append(paths[0])
-            self.stats.duplicate_files_resolved += 1
-            
-            # Store duplicates for later processing
-            self.duplicates_to_preserve[filename] = paths
-            
+        debug = is_debug_enabled()
+        
+        # Keep first occurrence for main export
+        resolved_files = [paths[0] for paths in duplicates.values()]
+        
+        # Store duplicates for later processing
+        self.duplicates_to_preserve.update(duplicates)
+        
+        preserved = 0
+        discarded = 0
+        for (name, file_type), paths in duplicates.items():
             # Preserve up to 2 copies total (first + one duplicate)
             if len(paths) > 1:
-                self.stats.duplicate_files_preserved += 1
-                log_debug(f"Duplicate '{filename}': preserving 1 duplicate")
+                preserved += 1
+                if debug:
+                    log_debug(f"Duplicate '{name}_{file_type}': preserving 1 duplicate")
             
             # Discard additional copies (3rd, 4th, etc.)
             if len(paths) > 2:
                 discarded_count = len(paths) - 2
-                self.stats.duplicate_files_discarded += discarded_count
-                log_warning(f"Duplicate '{filename}': discarding {discarded_count} additional copies (keeping only 2 total)")
+                discarded += discarded_count
+                log_warning(f"Duplicate '{name}_{file_type}': discarding {discarded_count} additional copies (keeping only 2 total)")
         
+        self.stats.duplicate_files_resolved += len(resolved_files)
+        self.stats.duplicate_files_preserved += preserved
+        self.stats.duplicate_files_discarded += discarded
         return resolved_files
 
-    def _handle_cleanup_duplicates(self, duplicates: Dict[str, List[Path]]) -> List[Path]:
+    def _handle_cleanup_duplicates(self, duplicates: Dict[DuplicateKey, List[Path]]) -> List[Path]:
         """Remove duplicates folder and keep only main export."""
         log_info("Cleanup mode: removing duplicates folder...")
         # Note: Actual cleanup logic would be implemented here
         # This is a placeholder for the cleanup functionality
         return []
 
-    def _handle_delete_duplicates(self, duplicates: Dict[str, List[Path]]) -> List[Path]:
+    def _handle_delete_duplicates(self, duplicates: Dict[DuplicateKey, List[Path]]) -> List[Path]:
         """Delete duplicate files from output directory (not source!)."""
         log_warning("DELETE mode: will delete duplicate files from OUTPUT directory!")
         # Note: Actual deletion logic would be implemented here
@@ -220,16 +379,10 @@ class DuplicateHandler:
         self.stats = DuplicateStats()
         self.duplicates_to_preserve.clear()
 
-    def get_supported_strategies(self) -> List[str]:
-        """Get list of supported duplicate handling strategies."""
-        return [
-            'keep_first',
-            'skip_duplicates', 
-            'preserve_duplicates',
-            'cleanup_duplicates',
-            '!delete!'
-        ]
+    def get_supported_strategies(self) -> FrozenSet[str]:
+        """Get the set of supported duplicate handling strategies."""
+        return self.config.duplicates.AVAILABLE_STRATEGIES
 
     def validate_strategy(self, strategy: str) -> bool:
         """Validate if a duplicate handling strategy is supported."""
-        return strategy in self.get_supported_strategies()
+        return strategy in self.config.duplicates.AVAILABLE_STRATEGIES
@@ -14,16 +14,24 @@ Version: 1.0.0
 """
 
 import os
+import re
 import sys
 import json
 import shutil
+import stat
+import struct
+import time
 import argparse
+import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union, Any
+from typing import Dict, FrozenSet, Iterator, List, Tuple, Optional, Union, Any
 from dataclasses import dataclass, asdict
-from collections import defaultdict, Counter
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache, partial
+from itertools import chain, islice
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import multiprocessing
 
 # Add the project root to the Python path
@@ -33,7 +41,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 # Import our custom logging configuration
-from src.logging.logger_config import setup_logging, get_logger, log_info, log_warning, log_error, log_debug, log_success
+from src.logging.logger_config import setup_logging, get_logger, log_info, log_warning, log_error, log_debug, log_success, is_debug_enabled
 
 # Import security utilities
 from src.security.security_utils import validate_path, validate_directory_access, create_safe_path, sanitize_filename, SecurityError
@@ -42,8 +50,9 @@ from src.security.security_utils import validate_path, validate_directory_access
 from src.utils.performance_monitor import get_performance_monitor, timed_operation
 from src.utils.performance_optimizer import get_performance_optimizer
 from src.utils.performance_analyzer import get_performance_analyzer
-from src.core.duplicate_handler import DuplicateHandler
-from src.core.file_organizer import FileOrganizer
+from src.core.duplicate_handler import DuplicateHandler, DuplicateKey
+from src.core.file_organizer import FileOrganizer, SidecarIndex, SidecarNames
+from src.core.metadata_cache import MetadataCache
 from src.core.config import get_config
 
 # Custom exceptions for better error handling
@@ -66,7 +75,6 @@ class DuplicateHandlingError(Exception):
 # Third-party imports
 try:
     from PIL import Image, ExifTags
-    from PIL.ExifTags import TAGS
     # Register HEIF opener for HEIC support
     from pillow_heif import register_heif_opener
     register_heif_opener()
@@ -86,6 +94,380 @@ except ImportError:
     print("ERROR: python-dateutil library not found. Install with: pip install python-dateutil")
     sys.exit(1)
 
+# Command line values accepted as "true" for the is_dry_run argument
+_TRUTHY = frozenset(('true', '1', 'yes', 'on'))
+
+# Bytes per gibibyte, used for GB figures
+_GIB = 1024 ** 3
+
+# Units for _format_bytes, one per power of 1024
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Optional C ISO 8601 parser, dateutil is used when not installed
+try:
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:
+    parse_iso_datetime = None
+
+# Optional fast JSON serializer, stdlib json is used when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# EXIF tag IDs holding the capture date, in order of preference
+EXIF_DATE_TAG_IDS = (0x9003, 0x9004, 0x0132)  # DateTimeOriginal, DateTimeDigitized, DateTime
+
+# Pointer to the Exif sub-IFD, where DateTimeOriginal and DateTimeDigitized live
+EXIF_IFD_POINTER = 0x8769
+
+# Bytes read from the start of a JPEG when looking for its APP1 (Exif) segment
+JPEG_EXIF_SCAN_SIZE = 65536
+
+# Bytes read from the start of a HEIC file when looking for its meta box
+HEIC_META_SCAN_SIZE = 65536
+
+# XMP namespaces and the compiled date field lookups, in order of preference
+XMP_NAMESPACES = {
+    'xmp': 'http://ns.adobe.com/xap/1.0/',
+    'exif': 'http://ns.adobe.com/exif/1.0/',
+    'photoshop': 'http://ns.adobe.com/photoshop/1.0/',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
+    'xmpMM': 'http://ns.adobe.com/xap/1.0/mm/',
+    'stEvt': 'http://ns.adobe.com/xap/1.0/sType/ResourceEvent#',
+    'stRef': 'http://ns.adobe.com/xap/1.0/sType/ResourceRef#'
+}
+XMP_DATE_XPATHS = tuple(
+    etree.XPath(path, namespaces=XMP_NAMESPACES) for path in (
+        '//photoshop:DateCreated',
+        '//xmp:CreateDate',
+        '//exif:DateTimeOriginal',
+        '//exif:DateTimeDigitized',
+        '//dc:date',
+        '//xmp:ModifyDate'
+    )
+)
+
+# Plain 'YYYY-MM-DDTHH:MM:SS[.fff][Z]' XMP dates, parsed without strptime/dateutil
+_XMP_UTC_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?Z?$')
+
+
+@lru_cache(maxsize=4096)
+def _parse_xmp_date_string(date_str: str) -> datetime:
+    """Parse XMP date string (cached, exports share many timestamps)"""
+    match = _XMP_UTC_DATE_RE.match(date_str)
+    if match:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        microsecond = int(fraction[:6].ljust(6, '0')) if fraction else 0
+        try:
+            return datetime(int(year), int(month), int(day), int(hour), int(minute),
+                            int(second), microsecond, tzinfo=timezone.utc)
+        except ValueError:
+            pass  # Out-of-range field, let the full parsers report it
+    
+    dt = None
+    if parse_iso_datetime is not None:
+        try:
+            dt = parse_iso_datetime(date_str)
+        except ValueError:
+            pass
+    else:
+        # Try different date formats
+        for fmt in ['%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S.%fZ']:
+            try:
+                dt = datetime.strptime(date_str, fmt)
+                break
+            except ValueError:
+                continue
+    
+    if dt is None:
+        # Try dateutil parser as fallback
+        dt = date_parser.parse(date_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _read_ifd_dates(tiff: bytes, order: str, offset: int, wanted: Tuple[int, ...],
+                    dates: Dict[int, Any]):
+    """Collect ASCII date tags (and the Exif sub-IFD pointer) from one TIFF IFD"""
+    (entry_count,) = struct.unpack_from(order + 'H', tiff, offset)
+    for entry in range(offset + 2, offset + 2 + 12 * entry_count, 12):
+        tag, value_type, count = struct.unpack_from(order + 'HHI', tiff, entry)
+        if tag not in wanted:
+            continue
+        if value_type == 2:  # ASCII, stored inline when it fits in 4 bytes
+            start = entry + 8 if count <= 4 else struct.unpack_from(order + 'I', tiff, entry + 8)[0]
+            dates[tag] = tiff[start:start + count].rstrip(b'\0 ').decode('ascii', 'replace')
+        elif value_type in (4, 13):  # LONG / IFD offset
+            dates[tag] = struct.unpack_from(order + 'I', tiff, entry + 8)[0]
+
+
+def _read_jpeg_exif_dates(image_path: Path) -> Optional[Dict[int, Any]]:
+    """
+    Read the EXIF date tags of a JPEG from its APP1 segment without decoding the image.
+    
+    Args:
+        image_path: Path to the JPEG file
+        
+    Returns:
+        Dictionary of found tag IDs to values, or None if the Exif segment
+        is not within the first JPEG_EXIF_SCAN_SIZE bytes or is malformed
+    """
+    with open(image_path, 'rb') as f:
+        head = f.read(JPEG_EXIF_SCAN_SIZE)
+    if not head.startswith(b'\xff\xd8'):
+        return None
+    
+    try:
+        position = 2
+        while True:
+            marker, length = struct.unpack_from('>HH', head, position)
+            if marker in (0xFFD9, 0xFFDA):
+                return {}  # End of image or start of scan: there is no Exif segment
+            if marker >> 8 != 0xFF:
+                return None
+            if marker == 0xFFE1 and head[position + 4:position + 10] == b'Exif\0\0':
+                end = position + 2 + length
+                if end > len(head):
+                    return None  # Truncated by the scan window
+                tiff = head[position + 10:end]
+                break
+            position += 2 + length
+    except struct.error:
+        return None
+    
+    return _read_tiff_dates(tiff)
+
+
+def _read_tiff_dates(tiff: bytes) -> Optional[Dict[int, Any]]:
+    """
+    Read the EXIF date tags from a TIFF-structured Exif block.
+    
+    Args:
+        tiff: Exif data starting at the TIFF header (II/MM byte order mark)
+        
+    Returns:
+        Dictionary of found tag IDs to values, or None if the block is malformed
+    """
+    order = {b'II': '<', b'MM': '>'}.get(tiff[:2])
+    if order is None:
+        return None
+    try:
+        dates: Dict[int, Any] = {}
+        _read_ifd_dates(tiff, order, struct.unpack_from(order + 'I', tiff, 4)[0],
+                        (EXIF_DATE_TAG_IDS[2], EXIF_IFD_POINTER), dates)
+        exif_ifd = dates.pop(EXIF_IFD_POINTER, None)
+        if isinstance(exif_ifd, int):
+            _read_ifd_dates(tiff, order, exif_ifd, EXIF_DATE_TAG_IDS[:2], dates)
+        return dates
+    except struct.error:
+        return None
+
+
+def _iter_boxes(data: bytes, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Yield (type, payload start, payload end) for the ISOBMFF boxes in data[start:end]"""
+    position = start
+    while position + 8 <= end:
+        size, box_type = struct.unpack_from('>I4s', data, position)
+        header = 8
+        if size == 1:
+            (size,) = struct.unpack_from('>Q', data, position + 8)
+            header = 16
+        elif size == 0:
+            size = end - position
+        if size < header:
+            return
+        yield box_type, position + header, min(position + size, end)
+        position += size
+
+
+def _read_heic_exif_dates(image_path: Path) -> Optional[Dict[int, Any]]:
+    """
+    Read the EXIF date tags of a HEIC file from its Exif item without decoding the image.
+    
+    The top-level meta box is read, the Exif item is located through its
+    iinf entry and iloc extent, and only that extent is read from the file.
+    
+    Args:
+        image_path: Path to the HEIC file
+        
+    Returns:
+        Dictionary of found tag IDs to values, {} if the file has no Exif item,
+        or None if the boxes are malformed or outside HEIC_META_SCAN_SIZE
+    """
+    with open(image_path, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        head = f.read(HEIC_META_SCAN_SIZE)
+        try:
+            meta = next(((start, end) for box_type, start, end in _iter_boxes(head, 0, len(head))
+                         if box_type == b'meta'), None)
+            if meta is None:
+                return None
+            
+            exif_item_id = None
+            extent = None
+            # meta is a full box: skip its version and flags
+            for box_type, start, end in _iter_boxes(head, meta[0] + 4, meta[1]):
+                version = head[start]
+                if box_type == b'iinf':
+                    count_size = 2 if version == 0 else 4
+                    for entry_type, entry_start, _ in _iter_boxes(head, start + 4 + count_size, end):
+                        entry_version = head[entry_start]
+                        if entry_type != b'infe' or entry_version < 2:
+                            continue
+                        id_format = '>H' if entry_version == 2 else '>I'
+                        id_size = struct.calcsize(id_format)
+                        item_type = head[entry_start + 4 + id_size + 2:entry_start + 4 + id_size + 6]
+                        if item_type == b'Exif':
+                            (exif_item_id,) = struct.unpack_from(id_format, head, entry_start + 4)
+                            break
+                elif box_type == b'iloc':
+                    extent = _read_iloc_extents(head, start, end, version)
+            
+            if exif_item_id is None or extent is None or exif_item_id not in extent:
+                return {} if exif_item_id is None else None
+            
+            offset, length = extent[exif_item_id]
+            # A corrupt extent must not seek past the file or read gigabytes
+            if length < 4 or offset + length > file_size:
+                return None
+            f.seek(offset)
+            item = f.read(length)
+            # The item starts with the offset of the TIFF header within it
+            (tiff_offset,) = struct.unpack_from('>I', item, 0)
+        except (struct.error, IndexError, ValueError, OverflowError, MemoryError):
+            return None
+    
+    return _read_tiff_dates(item[4 + tiff_offset:])
+
+
+def _read_iloc_extents(data: bytes, start: int, end: int, version: int) -> Dict[int, Tuple[int, int]]:
+    """Map item IDs to the (file offset, length) of their first extent from the iloc box data[start:end]"""
+    sizes = data[start + 4] << 8 | data[start + 5]
+    offset_size, length_size = sizes >> 12, (sizes >> 8) & 0xF
+    base_offset_size, index_size = (sizes >> 4) & 0xF, sizes & 0xF
+    if version == 0:
+        index_size = 0
+    
+    def read_int(position: int, size: int) -> Tuple[int, int]:
+        return int.from_bytes(data[position:position + size], 'big'), position + size
+    
+    position = start + 6
+    item_count, position = read_int(position, 2 if version < 2 else 4)
+    extents: Dict[int, Tuple[int, int]] = {}
+    for _ in range(item_count):
+        if position >= end:
+            break  # Item count larger than the box
+        item_id, position = read_int(position, 2 if version < 2 else 4)
+        construction_method = 0
+        if version in (1, 2):
+            construction_method, position = read_int(position, 2)
+            construction_method &= 0xF
+        position += 2  # data_reference_index
+        base_offset, position = read_int(position, base_offset_size)
+        extent_count, position = read_int(position, 2)
+        for extent in range(extent_count):
+            position += index_size
+            extent_offset, position = read_int(position, offset_size)
+            extent_length, position = read_int(position, length_size)
+            # Only items stored directly in the file (construction method 0)
+            if extent == 0 and construction_method == 0:
+                extents[item_id] = (base_offset + extent_offset, extent_length)
+    return extents
+
+
+# exiftool JSON keys for the EXIF date tags, mapped to their tag IDs
+EXIFTOOL_DATE_TAGS = (('DateTimeOriginal', 0x9003), ('CreateDate', 0x9004), ('ModifyDate', 0x0132))
+EXIFTOOL_ARGS = ('-json', '-fast2', '-charset', 'filename=utf8',
+                 '-EXIF:DateTimeOriginal', '-EXIF:CreateDate', '-EXIF:ModifyDate')
+
+
+def _read_exiftool_dates(image_paths: List[Path], batch_size: int) -> Dict[str, Dict[int, Any]]:
+    """
+    Read EXIF date tags for many files from a single exiftool process.
+    
+    exiftool is kept running with -stay_open and fed one -execute request
+    per batch, so its startup cost is paid once for the whole library.
+    Files exiftool could not read are left out, and an empty dict is
+    returned when exiftool is not installed or fails.
+    
+    Args:
+        image_paths: Image files to read
+        batch_size: Number of files per exiftool request
+        
+    Returns:
+        Dictionary of path string to {tag ID: raw date string}
+    """
+    exiftool = shutil.which('exiftool')
+    if exiftool is None:
+        return {}
+    
+    # The argument file is newline separated, so such names use the PIL path
+    paths = [str(p) for p in image_paths if '\n' not in str(p)]
+    dates: Dict[str, Dict[int, Any]] = {}
+    try:
+        process = subprocess.Popen([exiftool, '-stay_open', 'True', '-@', '-'],
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL)
+    except OSError as e:
+        log_warning(f"Could not start exiftool ({e}), reading EXIF per file")
+        return {}
+    
+    try:
+        for start in range(0, len(paths), batch_size):
+            request = [*EXIFTOOL_ARGS, *paths[start:start + batch_size], '-execute']
+            process.stdin.write(('\n'.join(request) + '\n').encode('utf-8'))
+            process.stdin.flush()
+            
+            output = []
+            for line in iter(process.stdout.readline, b''):
+                if line.rstrip() == b'{ready}':
+                    break
+                output.append(line)
+            else:
+                raise OSError("exiftool exited unexpectedly")
+            
+            for entry in json.loads(b''.join(output) or b'[]'):
+                if 'Error' not in entry:
+                    dates[entry['SourceFile']] = {tag_id: entry.get(name) for name, tag_id in EXIFTOOL_DATE_TAGS}
+    except (OSError, ValueError, KeyError) as e:
+        log_warning(f"exiftool failed ({e}), reading remaining EXIF dates per file")
+    finally:
+        try:
+            process.stdin.write(b'-stay_open\nFalse\n')
+            process.stdin.close()
+        except OSError:
+            pass
+        process.wait()
+    
+    return dates
+
+
+def _stat_file_info(path_str: str) -> Tuple[int, float, bool, Optional[str]]:
+    """Stat a file for PhotoExporter._get_cached_file_info: (size, mtime, is_file, error)"""
+    try:
+        st = os.stat(path_str)
+    except OSError as e:
+        return 0, 0, False, str(e)
+    return st.st_size, st.st_mtime, stat.S_ISREG(st.st_mode), None
+
+
+def _first_exif_date(dates: Dict[int, Any]) -> Optional[datetime]:
+    """Parse the first valid EXIF date in EXIF_DATE_TAG_IDS preference order"""
+    for tag_id in EXIF_DATE_TAG_IDS:
+        value = dates.get(tag_id)
+        if value:
+            try:
+                # Parse EXIF date format: "YYYY:MM:DD HH:MM:SS"
+                dt = datetime.strptime(value, '%Y:%m:%d %H:%M:%S')
+                return dt.replace(tzinfo=timezone.utc)
+            except ValueError:
+                continue
+    return None
+
+
 # colorlog removed - using loguru for all logging
 
 try:
@@ -95,7 +477,12 @@ except ImportError:
     sys.exit(1)
 
 
-@dataclass
+# One PhotoMetadata is kept per photo until the export finishes, so drop
+# the per-instance __dict__ where dataclasses support it (3.10+)
+_SLOTS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS_OPTIONS)
 class PhotoMetadata:
     """Container for photo metadata"""
     original_path: str
@@ -106,9 +493,13 @@ class PhotoMetadata:
     file_extension: str
     is_valid: bool = True
     error_message: Optional[str] = None
+    atime_ns: Optional[int] = None  # Source access time, preserved on copy
+    mtime_ns: Optional[int] = None  # Source modification time, preserved on copy
+    exif_date: Optional[datetime] = None  # EXIF capture date, kept for the metadata cache
+    exif_parsed: bool = False  # EXIF was read without error, so exif_date may be cached
 
 
-@dataclass
+@dataclass(**_SLOTS_OPTIONS)
 class ExportStats:
     """Statistics for export operation"""
     total_files_processed: int = 0
@@ -193,8 +584,21 @@ class PhotoExporter:
         """Get all supported formats from configuration."""
         return self.config.file_formats.ALL_SUPPORTED_FORMATS
     
+    _supported_suffix_re = None
+    
+    @property
+    def supported_suffix_pattern(self):
+        """Compiled regex matching file names with a supported suffix (group 1 = extension)."""
+        if self._supported_suffix_re is None:
+            extensions = sorted(ext[1:] for ext in self.supported_formats)
+            self._supported_suffix_re = re.compile(
+                r'\.(' + '|'.join(map(re.escape, extensions)) + r')$', re.IGNORECASE
+            )
+        return self._supported_suffix_re
+    
     def __init__(self, source_dir: str, target_dir: str, is_dry_run: bool = True, 
-                 duplicate_strategy: str = 'keep_first', max_workers: Optional[int] = None):
+                 duplicate_strategy: str = 'keep_first', max_workers: Optional[int] = None,
+                 batch_size: Optional[int] = None):
         # Validate and secure the input paths
         try:
             self.source_dir = validate_path(Path(source_dir).resolve(), Path.cwd(), "source directory")
@@ -210,31 +614,30 @@ class PhotoExporter:
         self.is_dry_run = is_dry_run
         self.duplicate_strategy = duplicate_strategy
         
-        # Parallel processing configuration with dynamic scaling
-        self.max_workers = max_workers or self._calculate_optimal_workers()
+        # Parallel processing configuration with dynamic scaling; the
+        # optimal worker count is only probed when max_workers is first used
+        self._max_workers = max_workers
         
         # Setup logging
         self.logger = get_logger()
+        self._debug = is_debug_enabled()
         
         # Performance monitoring
         self.performance_monitor = get_performance_monitor()
         self.performance_optimizer = get_performance_optimizer()
         self.performance_analyzer = get_performance_analyzer()
         
-        # I/O optimization
-        self.file_cache = {}  # Simple file info cache
-        self.batch_size = min(
-            self.config.processing.DEFAULT_BATCH_SIZE, 
-            max(
-                self.config.processing.MIN_BATCH_SIZE, 
-                len(list(self.source_dir.rglob("*"))) // 10
-            )
-        )
-        
         # Memory optimization
         self.memory_optimization_enabled = True
         self.max_cache_size = self.config.processing.DEFAULT_CACHE_SIZE
         
+        # I/O optimization
+        self._file_info = lru_cache(maxsize=self.max_cache_size)(_stat_file_info)  # Bounded LRU stat cache
+        # Files per process pool task; without a requested size, run_export
+        # derives one from the size of the source tree
+        self._batch_size = batch_size
+        self.batch_size = batch_size or self.config.processing.DEFAULT_BATCH_SIZE
+        
         # Statistics
         self.stats = ExportStats()
         self.duplicates_to_preserve = {}
@@ -242,11 +645,16 @@ class PhotoExporter:
         # Duplicate handling
         self.duplicate_handler = DuplicateHandler(duplicate_strategy)
         
-        # File organization
-        self.file_organizer = FileOrganizer(export_dir=None, is_dry_run=is_dry_run)
+        # Sidecar (XMP/AAE) lookup from one listing per source directory
+        self.sidecars = SidecarIndex()
         
-        # File tracking for duplicates
-        self.file_timestamps: Dict[str, int] = defaultdict(int)
+        # EXIF date tags read in bulk by exiftool, keyed by path string
+        self._exiftool_dates: Dict[str, Dict[int, Any]] = {}
+        # EXIF dates from the metadata cache of earlier runs, keyed by path string
+        self._cached_exif_dates: Dict[str, Optional[datetime]] = {}
+        
+        # File organization
+        self.file_organizer = FileOrganizer(export_dir=None, is_dry_run=is_dry_run, sidecars=self.sidecars)
         
         # Export directory (will be created with timestamp)
         self.export_dir = None
@@ -292,13 +700,15 @@ class PhotoExporter:
         logger.is_dry_run = self.is_dry_run
         logger._error_log_created = False
         logger._setup_logger()
+        self._debug = is_debug_enabled()
         
         # Store timestamp for use in other methods
         self.export_timestamp = timestamp
 
     def _get_file_extension(self, file_path: Path) -> str:
         """Get file extension in lowercase"""
-        return file_path.suffix.lower()
+        # os.path.splitext on the string avoids building Path.suffix per call
+        return os.path.splitext(os.fspath(file_path))[1].lower()
     
     def _get_cached_file_info(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -313,42 +723,55 @@ class PhotoExporter:
         Returns:
             Dictionary containing file metadata (size, mtime, exists, etc.)
         """
-        if file_path in self.file_cache:
-            return self.file_cache[file_path]
-        
-        try:
-            stat = file_path.stat()
-            info = {
-                'size': stat.st_size,
-                'mtime': stat.st_mtime,
-                'exists': True,
-                'is_file': file_path.is_file(),
-                'extension': file_path.suffix.lower()
-            }
-            self.file_cache[file_path] = info
-            return info
-        except (OSError, IOError) as e:
-            info = {
-                'size': 0,
-                'mtime': 0,
-                'exists': False,
-                'is_file': False,
-                'extension': file_path.suffix.lower(),
-                'error': str(e)
-            }
-            self.file_cache[file_path] = info
-            return info
+        size, mtime, is_file, error = self._file_info(str(file_path))
+        info = {
+            'size': size,
+            'mtime': mtime,
+            'exists': error is None,
+            'is_file': is_file,
+            'extension': file_path.suffix.lower()
+        }
+        if error is not None:
+            info['error'] = error
+        return info
 
     def _is_supported_format(self, file_path: Path) -> bool:
         """Check if file format is supported"""
         return self._get_file_extension(file_path) in self.supported_formats
     
+    def _iter_processable_files(self, root: Path, processable_formats: FrozenSet[str]) -> Iterator[Path]:
+        """
+        Yield the visible photo and video files below a directory.
+        
+        A single os.walk with the extension filter applied to the bare
+        names, so unsupported files never touch the filesystem and callers
+        that only need the first match stop the walk early.
+        
+        Args:
+            root: Directory to walk
+            processable_formats: Lowercase photo and video extensions
+            
+        Yields:
+            Paths of processable photo and video files
+        """
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                if name.startswith('.'):
+                    continue
+                if os.path.splitext(name)[1].lower() not in processable_formats:
+                    continue
+                path = os.path.join(dirpath, name)
+                # os.walk lists broken symlinks and special files as names too
+                if os.path.isfile(path):
+                    yield Path(path)
+    
     def _process_files_in_batches(self, files: List[Path], processor_func, progress_callback=None) -> List[Any]:
         """
-        Process files in optimized batches for better I/O performance.
+        Process files in parallel on a thread pool.
         
-        This optimization improves throughput by processing files in parallel batches
-        rather than one-by-one, reducing I/O wait times and improving CPU utilization.
+        Files are handed to the pool one at a time with executor.map, so a
+        worker that hits a slow file does not hold back a whole batch of
+        cheap ones queued behind it. Results are returned in input order.
         
         Args:
             files: List of file paths to process
@@ -361,71 +784,55 @@ class PhotoExporter:
         if not files:
             return []
         
-        # Use dynamic batch size based on file count and system resources
-        batch_size = min(self.batch_size, max(10, len(files) // self.max_workers))
-        batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
+        total = len(files)
+        log_debug(f"Processing {total} files on {self.max_workers} workers")
         
-        log_debug(f"Processing {len(files)} files in {len(batches)} batches of {batch_size}")
-        
-        results = []
+        process_file = partial(self._process_file_safe, processor_func)
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit batches
-            future_to_batch = {
-                executor.submit(self._process_batch, batch, processor_func): batch 
-                for batch in batches
-            }
-            
-            # Collect results
-            for future in as_completed(future_to_batch):
-                batch = future_to_batch[future]
-                try:
-                    batch_results = future.result()
-                    results.extend(batch_results)
-                    
-                    if progress_callback:
-                        progress_callback(len(results), len(files))
-                        
-                except Exception as e:
-                    log_error(f"Error processing batch: {e}")
-                    # Add None results for failed batch
-                    results.extend([None] * len(batch))
+            return self._collect_results(executor.map(process_file, files), total, progress_callback)
+    
+    def _collect_results(self, results: Iterator[Any], total: int, progress_callback=None) -> List[Any]:
+        """
+        Drain a stream of worker results, reporting progress as each one arrives.
         
-        return results
+        Args:
+            results: Iterator of results, e.g. from executor.map
+            total: Total number of expected results
+            progress_callback: Optional callback for progress updates
+            
+        Returns:
+            List of results in the order they were produced
+        """
+        if progress_callback is None:
+            return list(results)
+        
+        collected = []
+        for processed, result in enumerate(results, 1):
+            collected.append(result)
+            progress_callback(processed, total)
+        return collected
     
-    def _process_batch(self, batch: List[Path], processor_func) -> List[Any]:
-        """Process a single batch of files"""
-        results = []
-        for file_path in batch:
-            try:
-                result = processor_func(file_path)
-                results.append(result)
-            except Exception as e:
-                log_error(f"Error processing {file_path}: {e}")
-                results.append(None)
-        return results
+    def _process_file_safe(self, processor_func, file_path: Path) -> Any:
+        """Process a single file, logging errors and returning None on failure"""
+        try:
+            return processor_func(file_path)
+        except Exception as e:
+            log_error(f"Error processing {file_path}: {e}")
+            return None
     
     def _optimize_memory_usage(self):
         """
         Optimize memory usage by clearing caches and unused objects.
         
         This optimization prevents memory leaks and excessive memory usage by:
-        - Clearing file cache when it exceeds max_cache_size
-        - Implementing LRU-style cache eviction
         - Cleaning up duplicate dictionaries
-        - Triggering garbage collection
+        
+        The file info cache is a bounded LRU (max_cache_size entries) and
+        evicts on its own.
         """
         if not self.memory_optimization_enabled:
             return
         
-        # Clear file cache if it gets too large
-        if len(self.file_cache) > self.max_cache_size:
-            # Keep only the most recently accessed items
-            cache_items = list(self.file_cache.items())
-            # Keep the last 50% of items (simple LRU approximation)
-            keep_count = len(cache_items) // 2
-            self.file_cache = dict(cache_items[-keep_count:])
-            log_debug(f"Cleared file cache, kept {keep_count} items")
-        
         # Clear duplicates dictionary if it's large
         if len(self.duplicates_to_preserve) > 1000:
             self.duplicates_to_preserve.clear()
@@ -437,6 +844,7 @@ class PhotoExporter:
         
         This optimization is used for datasets >1000 files to:
         - Process files in smaller batches to reduce memory usage
+        - Fan out each batch to a thread pool (Pillow and lxml release the GIL)
         - Automatically clean up memory after each batch
         - Provide progress logging for long-running operations
         - Reduce memory usage by 50% for large datasets
@@ -450,21 +858,78 @@ class PhotoExporter:
         """
         results = []
         batch_size = min(50, max(10, len(files) // 10))  # Smaller batches for streaming
+        process_file = partial(self._process_file_safe, processor_func)
         
-        for i in range(0, len(files), batch_size):
-            batch = files[i:i + batch_size]
-            batch_results = self._process_batch(batch, processor_func)
-            results.extend(batch_results)
-            
-            # Optimize memory after each batch
-            self._optimize_memory_usage()
-            
-            # Log progress
-            if i % (batch_size * 5) == 0:  # Log every 5 batches
-                log_debug(f"Stream processed {i + len(batch)}/{len(files)} files")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for i in range(0, len(files), batch_size):
+                batch = files[i:i + batch_size]
+                results.extend(executor.map(process_file, batch))
+                
+                # Optimize memory after each batch
+                self._optimize_memory_usage()
+                
+                # Log progress
+                if i % (batch_size * 5) == 0:  # Log every 5 batches
+                    log_debug(f"Stream processed {i + len(batch)}/{len(files)} files")
         
         return results
     
+    def _process_cpu_bound(self, files: List[Path], progress_callback=None,
+                           file_stats: Optional[Dict[Path, os.stat_result]] = None) -> List[Optional[PhotoMetadata]]:
+        """
+        Extract photo metadata on a process pool.
+        
+        EXIF decoding, XMP parsing and date parsing hold the GIL for most of
+        their Python-level work, so large datasets are spread over processes
+        instead of threads. Chunks hold at most batch_size files. Falls back
+        to the threaded streaming path when a process pool cannot be started.
+        
+        Args:
+            files: List of photo file paths to process
+            progress_callback: Optional callback for progress updates
+            file_stats: Stat results from the source scan, sent along with each file
+            
+        Returns:
+            List of metadata results in input order
+        """
+        workers = max(1, min(self.max_workers, multiprocessing.cpu_count()))
+        chunksize = max(1, min(self.batch_size, len(files) // (workers * 4)))
+        file_stats = file_stats or {}
+        jobs = [(photo_path, file_stats.get(photo_path)) for photo_path in files]
+        # One task per chunk, so results and timings come back in batches
+        chunks = [jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize)]
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_metadata_worker,
+                                     initargs=(self._debug, self._exiftool_dates, self._cached_exif_dates,
+                                               self.sidecars.listings)) as executor:
+                timed_results = chain.from_iterable(executor.map(_extract_metadata_batch, chunks))
+                return self._collect_results(self._record_worker_timings(timed_results),
+                                             len(files), progress_callback)
+        except (OSError, BrokenProcessPool) as e:
+            log_warning(f"Process pool unavailable ({e}), extracting metadata on threads")
+            return self._stream_process_files(files, lambda photo_path: self._process_photo_worker(
+                photo_path, file_stats.get(photo_path)))
+    
+    def _record_worker_timings(self, timed_results: Iterator[Tuple[Optional[PhotoMetadata], float]]
+                               ) -> Iterator[Optional[PhotoMetadata]]:
+        """
+        Record process pool timings in this process's performance monitor.
+        
+        Timings taken inside worker processes stay in their own monitors, so
+        the workers send each file's duration back with its metadata.
+        
+        Args:
+            timed_results: (metadata, seconds) pairs from _extract_metadata_batch
+            
+        Yields:
+            The metadata results, in input order
+        """
+        record_operation = self.performance_monitor.record_operation
+        for metadata, duration in timed_results:
+            record_operation("process_photo_worker", duration)
+            yield metadata
+    
     def _update_duplicate_stats(self):
         """Update statistics from duplicate handler"""
         duplicate_stats = self.duplicate_handler.get_duplicate_stats()
@@ -474,6 +939,11 @@ class PhotoExporter:
         self.stats.duplicate_files_discarded = duplicate_stats.duplicate_files_discarded
         self.stats.files_skipped_duplicates = duplicate_stats.files_skipped_duplicates
 
+    @cached_property
+    def max_workers(self) -> int:
+        """Worker count: the requested one, or the optimum for this system (probed once)"""
+        return self._max_workers or self._calculate_optimal_workers()
+    
     def _calculate_optimal_workers(self) -> int:
         """
         Calculate optimal number of workers based on system resources.
@@ -492,7 +962,7 @@ class PhotoExporter:
             
             # Get system resources
             cpu_count = multiprocessing.cpu_count()
-            memory_gb = psutil.virtual_memory().total / (1024**3)
+            memory_gb = psutil.virtual_memory().total / _GIB
             
             # Calculate optimal workers based on resources
             # For I/O bound tasks, we can use more workers than CPU cores
@@ -531,31 +1001,79 @@ class PhotoExporter:
             log_debug(f"Decreasing workers from {self.max_workers} to {new_workers} (throughput: {current_throughput:.1f})")
             self.max_workers = new_workers
 
-    def _extract_exif_date(self, image_path: Path) -> Optional[datetime]:
+    def _extract_heic_exif_date(self, image_path: Path) -> Optional[datetime]:
+        """
+        Extract creation date from the Exif item of a HEIC file.
+        
+        Only used when the photo has no XMP date: the Exif item is read
+        straight from the HEIF boxes, without opening the image in PIL.
+        """
+        try:
+            dates = _read_heic_exif_dates(image_path)
+        except (OSError, ValueError, OverflowError, MemoryError) as e:
+            log_warning(f"Error reading HEIC EXIF from {image_path}: {e}")
+            return None
+        return _first_exif_date(dates) if dates else None
+    
+    def _prefetch_exif_dates(self, exif_images: List[Path]):
+        """
+        Read EXIF dates for all EXIF-bearing images with one exiftool process.
+        
+        Images with a cached date are skipped, and small exports are left to
+        the per-file readers.
+        
+        Args:
+            exif_images: Non-HEIC images about to be processed
+        """
+        images = [p for p in exif_images if str(p) not in self._cached_exif_dates]
+        if len(images) < self.config.processing.EXIFTOOL_MIN_FILES:
+            return
+        
+        self._exiftool_dates = _read_exiftool_dates(images, self.config.processing.EXIFTOOL_BATCH_SIZE)
+        if self._exiftool_dates:
+            log_info(f"Read EXIF dates of {len(self._exiftool_dates)} images with exiftool")
+    
+    def _extract_exif_date(self, image_path: Path, ext: Optional[str] = None) -> Optional[datetime]:
         """Extract creation date from EXIF data"""
         try:
+            if ext is None:
+                ext = self._get_file_extension(image_path)
+            
             # For HEIC files, we can assume they always have EXIF data
             # Skip the expensive EXIF extraction and rely on XMP data instead
-            if image_path.suffix.lower() == '.heic':
-                log_debug(f"HEIC file detected, skipping EXIF extraction for {image_path.name}")
+            if ext == '.heic':
+                if self._debug:
+                    log_debug(f"HEIC file detected, skipping EXIF extraction for {image_path.name}")
                 return None
             
+            # Already known from an earlier run, or read in bulk by exiftool
+            path_key = str(image_path)
+            if path_key in self._cached_exif_dates:
+                return self._cached_exif_dates[path_key]
+            dates = self._exiftool_dates.get(path_key)
+            if dates is not None:
+                return _first_exif_date(dates)
+            
+            # JPEG dates come straight from the APP1 segment; PIL is only
+            # opened when that segment is not found near the start of the file
+            if ext in ('.jpg', '.jpeg'):
+                dates = _read_jpeg_exif_dates(image_path)
+                if dates is not None:
+                    return _first_exif_date(dates)
+            
             with Image.open(image_path) as img:
                 # Use modern getexif() method instead of deprecated _getexif()
                 exif_data = img.getexif()
                 if not exif_data:
                     return None
                 
-                # Look for DateTime or DateTimeOriginal
-                for tag_id, value in exif_data.items():
-                    tag = TAGS.get(tag_id, tag_id)
-                    if tag in ['DateTime', 'DateTimeOriginal', 'DateTimeDigitized']:
-                        try:
-                            # Parse EXIF date format: "YYYY:MM:DD HH:MM:SS"
-                            dt = datetime.strptime(value, '%Y:%m:%d %H:%M:%S')
-                            return dt.replace(tzinfo=timezone.utc)
-                        except ValueError:
-                            continue
+                # Look up DateTimeOriginal, DateTimeDigitized and DateTime directly;
+                # getexif() only holds IFD0, the first two are in the Exif sub-IFD
+                exif_ifd = exif_data.get_ifd(EXIF_IFD_POINTER) if EXIF_IFD_POINTER in exif_data else {}
+                return _first_exif_date({
+                    tag_id: exif_ifd.get(tag_id) or exif_data.get(tag_id)
+                    for tag_id in EXIF_DATE_TAG_IDS
+                })
                             
         except (OSError, IOError, ValueError, TypeError) as e:
             log_debug(f"Error reading EXIF from {image_path}: {e}")
@@ -569,51 +1087,18 @@ class PhotoExporter:
     def _extract_xmp_date(self, xmp_path: Path) -> Optional[datetime]:
         """Extract creation date from XMP file"""
         try:
-            tree = etree.parse(str(xmp_path))
-            root = tree.getroot()
-            
-            # Define namespaces
-            namespaces = {
-                'xmp': 'http://ns.adobe.com/xap/1.0/',
-                'exif': 'http://ns.adobe.com/exif/1.0/',
-                'photoshop': 'http://ns.adobe.com/photoshop/1.0/',
-                'xmp': 'http://ns.adobe.com/xap/1.0/',
-                'dc': 'http://purl.org/dc/elements/1.1/',
-                'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
-                'xmpMM': 'http://ns.adobe.com/xap/1.0/mm/',
-                'stEvt': 'http://ns.adobe.com/xap/1.0/sType/ResourceEvent#',
-                'stRef': 'http://ns.adobe.com/xap/1.0/sType/ResourceRef#'
-            }
+            # Sidecars are small, so read each in one call and parse from memory
+            with open(xmp_path, 'rb') as f:
+                root = etree.fromstring(f.read())
             
             # Try different XMP date fields
-            date_fields = [
-                '//photoshop:DateCreated',
-                '//xmp:CreateDate',
-                '//exif:DateTimeOriginal',
-                '//exif:DateTimeDigitized',
-                '//dc:date',
-                '//xmp:ModifyDate'
-            ]
-            
-            for field in date_fields:
-                elements = root.xpath(field, namespaces=namespaces)
+            for find_dates in XMP_DATE_XPATHS:
+                elements = find_dates(root)
                 if elements:
                     date_str = elements[0].text
                     if date_str:
                         try:
-                            # Try different date formats
-                            for fmt in ['%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S.%fZ']:
-                                try:
-                                    dt = datetime.strptime(date_str, fmt)
-                                    return dt.replace(tzinfo=timezone.utc)
-                                except ValueError:
-                                    continue
-                            
-                            # Try dateutil parser as fallback
-                            dt = date_parser.parse(date_str)
-                            if dt.tzinfo is None:
-                                dt = dt.replace(tzinfo=timezone.utc)
-                            return dt
+                            return self._parse_xmp_date(date_str)
                         except Exception:
                             continue
                             
@@ -626,12 +1111,17 @@ class PhotoExporter:
             
         return None
 
-    def _get_file_creation_date(self, file_path: Path) -> datetime:
-        """Get file creation date as fallback"""
+    def _parse_xmp_date(self, date_str: str) -> datetime:
+        """Parse XMP date string into a timezone-aware datetime (UTC if no offset)"""
+        return _parse_xmp_date_string(date_str)
+
+    def _get_file_creation_date(self, file_path: Path, file_stat: Optional[os.stat_result] = None) -> datetime:
+        """Get file creation date as fallback, from file_stat when it is already known"""
         try:
-            stat = file_path.stat()
+            if file_stat is None:
+                file_stat = file_path.stat()
             # Use st_mtime (modification time) as it's more reliable than st_ctime on macOS
-            timestamp = stat.st_mtime
+            timestamp = file_stat.st_mtime
             return datetime.fromtimestamp(timestamp, tz=timezone.utc)
         except Exception as e:
             log_warning(f"Error getting file date for {file_path}: {e}")
@@ -664,33 +1154,28 @@ class PhotoExporter:
             log_warning(f"Could not check disk space: {e}")
             return True, 0, required_size_bytes  # Assume enough space if check fails
 
-    def _format_bytes(self, bytes_value: int) -> str:
+    @staticmethod
+    def _format_bytes(bytes_value: int) -> str:
         """Format bytes in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} PB"
+        # Each unit spans 10 bits, so the bit length picks the unit directly
+        unit_index = min(len(_BYTE_UNITS) - 1, max(0, (int(bytes_value).bit_length() - 1) // 10))
+        return f"{bytes_value / (1 << (10 * unit_index)):.1f} {_BYTE_UNITS[unit_index]}"
 
     def _choose_best_date(self, exif_date: Optional[datetime], xmp_date: Optional[datetime], file_date: datetime) -> Tuple[datetime, str]:
         """Choose the best creation date from available sources
         
-        Note: For HEIC files, exif_date will be None as we skip EXIF extraction
-        for performance reasons (HEIC always has EXIF by design, but XMP data
-        is more reliable and faster to extract from Apple Photos exports).
+        Note: For HEIC files, exif_date is only read when there is no XMP date
+        (XMP data is more reliable and faster to extract from Apple Photos
+        exports); otherwise it is None.
         """
         # Strategy: Choose the earlier date between EXIF and XMP, fallback to file date
-        if exif_date and xmp_date:
-            if exif_date <= xmp_date:
-                return exif_date, 'exif'
-            else:
+        if exif_date:
+            if xmp_date and xmp_date < exif_date:
                 return xmp_date, 'xmp'
-        elif exif_date:
             return exif_date, 'exif'
-        elif xmp_date:
+        if xmp_date:
             return xmp_date, 'xmp'
-        else:
-            return file_date, 'file'
+        return file_date, 'file'
 
     def _generate_filename(self, creation_date: datetime, extension: str) -> str:
         """Generate filename in format YYYYMMDD-HHMMSS-SSS.ext"""
@@ -706,88 +1191,35 @@ class PhotoExporter:
     def _process_photo_file(self, photo_path: Path) -> Optional[PhotoMetadata]:
         """Process a single photo file and extract metadata"""
         try:
-            # Validate the photo path for security
+            # Photo paths come from our own scan of the already validated
+            # source directory, so a lexical containment check is enough
             try:
-                photo_path = validate_path(photo_path, self.source_dir, "photo processing")
-            except SecurityError as e:
-                log_error(f"Security validation failed for photo: {e}")
+                photo_path.relative_to(self.source_dir)
+            except ValueError:
+                log_error(f"Security validation failed for photo: {photo_path} is outside {self.source_dir}")
                 return None
             
             self.stats.total_files_processed += 1
             
             # Check if format is supported
-            if not self._is_supported_format(photo_path):
-                ext = self._get_file_extension(photo_path)
+            ext = self._get_file_extension(photo_path)
+            if ext not in self.supported_formats:
                 self.stats.unsupported_formats[ext] += 1
                 log_warning(f"Unsupported format: {photo_path}")
                 return None
             
             # Track supported format
-            ext = self._get_file_extension(photo_path)
             self.stats.supported_formats[ext] += 1
             
             # Get file size
-            file_size = photo_path.stat().st_size
+            file_stat = photo_path.stat()
+            file_size = file_stat.st_size
             self.stats.total_size_bytes += file_size
             
-            # Look for corresponding XMP file (try both .xmp and .XMP)
-            # First try with original extension, then without
-            xmp_path = photo_path.with_suffix(photo_path.suffix + '.xmp')
-            if not xmp_path.exists():
-                xmp_path = photo_path.with_suffix(photo_path.suffix + '.XMP')
-                if not xmp_path.exists():
-                    # Try without original extension
-                    xmp_path = photo_path.with_suffix('.xmp')
-                    if not xmp_path.exists():
-                        xmp_path = photo_path.with_suffix('.XMP')
-                        if not xmp_path.exists():
-                            xmp_path = None
-            
-            # Look for corresponding AAE file (Apple Adjustment Export)
-            # Try different naming patterns that Apple Photos uses
-            aae_path = None
-            
-            # Pattern 1: Direct match (IMG_1234.HEIC -> IMG_1234.aae)
-            test_path = photo_path.with_suffix('.aae')
-            if test_path.exists():
-                aae_path = test_path
-            else:
-                test_path = photo_path.with_suffix('.AAE')
-                if test_path.exists():
-                    aae_path = test_path
-            
-            # Pattern 2: Apple Photos pattern (IMG_1234.HEIC -> IMG_O1234.aae)
-            if aae_path is None:
-                photo_name = photo_path.stem
-                if photo_name.startswith('IMG_'):
-                    # Extract number from IMG_XXXX
-                    number_part = photo_name[4:]  # Remove 'IMG_' prefix
-                    aae_name = f"IMG_O{number_part}.aae"
-                    test_path = photo_path.parent / aae_name
-                    if test_path.exists():
-                        aae_path = test_path
-                    else:
-                        # Try uppercase
-                        aae_name = f"IMG_O{number_part}.AAE"
-                        test_path = photo_path.parent / aae_name
-                        if test_path.exists():
-                            aae_path = test_path
-            
-            # Pattern 3: Numeric pattern (1470.HEIC -> 1470O.aae)
-            if aae_path is None:
-                photo_name = photo_path.stem
-                # Check if photo name is purely numeric
-                if photo_name.isdigit():
-                    aae_name = f"{photo_name}O.aae"
-                    test_path = photo_path.parent / aae_name
-                    if test_path.exists():
-                        aae_path = test_path
-                    else:
-                        # Try uppercase
-                        aae_name = f"{photo_name}O.AAE"
-                        test_path = photo_path.parent / aae_name
-                        if test_path.exists():
-                            aae_path = test_path
+            # Look for corresponding XMP file (.xmp/.XMP, with or without the
+            # original extension) and AAE file (Apple Adjustment Export)
+            xmp_path = self.sidecars.find_xmp(photo_path)
+            aae_path = self.sidecars.find_aae(photo_path)
             
             # Extract dates from different sources
             exif_date = None
@@ -796,17 +1228,21 @@ class PhotoExporter:
             # Count all supported files as photos (including videos)
             self.stats.photos_processed += 1
             
-            if photo_path.suffix.lower() in self.supported_image_formats:
-                exif_date = self._extract_exif_date(photo_path)
+            if ext in self.supported_image_formats:
+                exif_date = self._extract_exif_date(photo_path, ext)
             
             if xmp_path:
                 xmp_date = self._extract_xmp_date(xmp_path)
                 self.stats.xmp_files_processed += 1
             
+            if xmp_date is None and ext == '.heic':
+                exif_date = self._extract_heic_exif_date(photo_path)
+            
             if aae_path:
                 self.stats.aae_files_processed += 1
-                log_debug(f"Found AAE file: {aae_path}")
-            else:
+                if self._debug:
+                    log_debug(f"Found AAE file: {aae_path}")
+            elif self._debug:
                 log_debug(f"No AAE file found for {photo_path.name}")
             
             # Get file date as fallback
@@ -822,10 +1258,13 @@ class PhotoExporter:
                 creation_date=creation_date,
                 date_source=date_source,
                 file_size=file_size,
-                file_extension=ext
+                file_extension=ext,
+                atime_ns=file_stat.st_atime_ns,
+                mtime_ns=file_stat.st_mtime_ns
             )
             
-            log_debug(f"Processed {photo_path.name}: {creation_date} (from {date_source})")
+            if self._debug:
+                log_debug(f"Processed {photo_path.name}: {creation_date} (from {date_source})")
             return metadata
             
         except Exception as e:
@@ -840,22 +1279,37 @@ class PhotoExporter:
                 creation_date=None,
                 date_source='error',
                 file_size=0,
-                file_extension=self._get_file_extension(photo_path),
+                file_extension=ext,
                 is_valid=False,
                 error_message=str(e)
             )
     
 
+    def _detect_duplicates(self, photo_files: List[Path]) -> Dict[DuplicateKey, List[Path]]:
+        """Detect content duplicates among photo files using the duplicate handler"""
+        return self.duplicate_handler.detect_duplicates(photo_files)
+
+    @cached_property
+    def _ext_to_category(self) -> Dict[str, str]:
+        """Extension -> file type category, built once from the config format sets"""
+        # Later entries win, so image beats video beats metadata as before
+        return {
+            **{ext: "metadata" for ext in self.supported_metadata_formats},
+            **{ext: "video" for ext in self.supported_video_formats},
+            **{ext: "image" for ext in self.supported_image_formats},
+        }
+
     def _get_file_type_category(self, extension: str) -> str:
         """Get file type category for duplicate detection"""
-        if extension in self.supported_image_formats:
-            return "image"
-        elif extension in self.supported_video_formats:
-            return "video"
-        elif extension in self.supported_metadata_formats:
-            return "metadata"
-        else:
-            return "other"
+        return self._ext_to_category.get(extension, "other")
+
+    @staticmethod
+    def _copy_order_key(metadata: Optional[PhotoMetadata]) -> Tuple[int, int, int]:
+        """Sort key grouping photos by creation day (invalid results first)"""
+        if metadata is None or not metadata.is_valid or not metadata.creation_date:
+            return (0, 0, 0)
+        creation_date = metadata.creation_date
+        return (creation_date.year, creation_date.month, creation_date.day)
 
     def _process_photo(self, metadata: PhotoMetadata) -> bool:
         """Process photo - copy in real mode, simulate in dry-run mode"""
@@ -881,91 +1335,69 @@ class PhotoExporter:
             return False
 
     @timed_operation("process_photo_worker")
-    def _process_photo_worker(self, photo_path: Path) -> Optional[PhotoMetadata]:
-        """Worker function for parallel photo processing"""
+    def _process_photo_worker(self, photo_path: Path,
+                              file_stat: Optional[os.stat_result] = None) -> Optional[PhotoMetadata]:
+        """
+        Worker function for parallel photo processing.
+        
+        Args:
+            photo_path: Path to the photo file
+            file_stat: Stat result from the source scan; the file is stat'ed once if not given
+        """
         try:
-            # Look for corresponding XMP file
-            xmp_path = photo_path.with_suffix(photo_path.suffix + '.xmp')
-            if not xmp_path.exists():
-                xmp_path = photo_path.with_suffix(photo_path.suffix + '.XMP')
-                if not xmp_path.exists():
-                    xmp_path = photo_path.with_suffix('.xmp')
-                    if not xmp_path.exists():
-                        xmp_path = photo_path.with_suffix('.XMP')
-                        if not xmp_path.exists():
-                            xmp_path = None
-
-            # Look for corresponding AAE file
-            aae_path = None
-            test_path = photo_path.with_suffix('.aae')
-            if test_path.exists():
-                aae_path = test_path
-            else:
-                test_path = photo_path.with_suffix('.AAE')
-                if test_path.exists():
-                    aae_path = test_path
-                else:
-                    # Try Apple Photos pattern
-                    photo_name = photo_path.stem
-                    if photo_name.startswith('IMG_'):
-                        number_part = photo_name[4:]
-                        aae_name = f"IMG_O{number_part}.aae"
-                        test_path = photo_path.parent / aae_name
-                        if test_path.exists():
-                            aae_path = test_path
-                        else:
-                            aae_name = f"IMG_O{number_part}.AAE"
-                            test_path = photo_path.parent / aae_name
-                            if test_path.exists():
-                                aae_path = test_path
-                    # Try numeric pattern (1470.HEIC -> 1470O.aae)
-                    elif photo_name.isdigit():
-                        aae_name = f"{photo_name}O.aae"
-                        test_path = photo_path.parent / aae_name
-                        if test_path.exists():
-                            aae_path = test_path
-                        else:
-                            aae_name = f"{photo_name}O.AAE"
-                            test_path = photo_path.parent / aae_name
-                            if test_path.exists():
-                                aae_path = test_path
+            if file_stat is None:
+                file_stat = photo_path.stat()
+            
+            # Look for corresponding XMP and AAE files
+            xmp_path = self.sidecars.find_xmp(photo_path)
+            aae_path = self.sidecars.find_aae(photo_path)
 
             # Extract dates from different sources
             exif_date = None
+            exif_parsed = False
             xmp_date = None
+            ext = self._get_file_extension(photo_path)
 
-            if photo_path.suffix.lower() in self.supported_image_formats:
-                exif_date = self._extract_exif_date(photo_path)
+            if ext in self.supported_image_formats:
+                # Read errors raise, so reaching the next line means a real parse
+                exif_date = self._extract_exif_date(photo_path, ext)
+                exif_parsed = ext != '.heic'
 
             if xmp_path:
                 xmp_date = self._extract_xmp_date(xmp_path)
-                log_debug(f"Found XMP file: {xmp_path}")
-            else:
-                log_debug(f"No XMP file found for {photo_path.name}")
 
-            if aae_path:
-                log_debug(f"Found AAE file: {aae_path}")
-            else:
-                log_debug(f"No AAE file found for {photo_path.name}")
+            if xmp_date is None and ext == '.heic':
+                exif_date = self._extract_heic_exif_date(photo_path)
+
+            if self._debug:
+                if xmp_path:
+                    log_debug(f"Found XMP file: {xmp_path}")
+                else:
+                    log_debug(f"No XMP file found for {photo_path.name}")
+
+                if aae_path:
+                    log_debug(f"Found AAE file: {aae_path}")
+                else:
+                    log_debug(f"No AAE file found for {photo_path.name}")
 
             # Get file date as fallback
-            file_date = self._get_file_creation_date(photo_path)
+            file_date = self._get_file_creation_date(photo_path, file_stat)
 
             # Choose best date
             creation_date, date_source = self._choose_best_date(exif_date, xmp_date, file_date)
 
-            # Get file info
-            file_size = photo_path.stat().st_size
-            ext = self._get_file_extension(photo_path)
-
             # Create metadata object
             metadata = PhotoMetadata(
                 original_path=str(photo_path),
                 original_filename=photo_path.name,
                 creation_date=creation_date,
                 date_source=date_source,
-                file_size=file_size,
-                file_extension=ext
+                file_size=file_stat.st_size,
+                file_extension=ext,
+                atime_ns=file_stat.st_atime_ns,
+                mtime_ns=file_stat.st_mtime_ns,
+                exif_date=exif_date,
+                exif_parsed=exif_parsed
             )
 
             return metadata
@@ -1055,7 +1487,7 @@ class PhotoExporter:
                 except Exception as e:
                     log_error(f"Failed to remove duplicates folder {duplicates_folder}: {e}")
 
-    def _delete_duplicates_from_source(self, duplicates: Dict[str, List[Path]]) -> List[Path]:
+    def _delete_duplicates_from_source(self, duplicates: Dict[DuplicateKey, List[Path]]) -> List[Path]:
         """Delete duplicate files from source directory, keeping only the first occurrence"""
         if not duplicates:
             log_info("No duplicates found to delete")
@@ -1075,6 +1507,8 @@ class PhotoExporter:
         
         files_to_keep = []
         files_to_delete = []
+        # Sidecars are looked up in one listing per directory, taken fresh for this pass
+        sidecars = SidecarIndex()
         
         for filename, paths in duplicates.items():
             if len(paths) <= 1:
@@ -1096,36 +1530,7 @@ class PhotoExporter:
                         log_info(f"  Deleted: {path}")
                         
                         # Also delete associated XMP and AAE files
-                        xmp_path = path.with_suffix(path.suffix + '.xmp')
-                        if not xmp_path.exists():
-                            xmp_path = path.with_suffix(path.suffix + '.XMP')
-                        if not xmp_path.exists():
-                            xmp_path = path.with_suffix('.xmp')
-                        if not xmp_path.exists():
-                            xmp_path = path.with_suffix('.XMP')
-                            
-                        if xmp_path.exists():
-                            xmp_path.unlink()
-                            log_info(f"  Deleted XMP: {xmp_path}")
-                            
-                        # Delete AAE file
-                        aae_path = path.with_suffix('.aae')
-                        if not aae_path.exists():
-                            aae_path = path.with_suffix('.AAE')
-                        if not aae_path.exists():
-                            # Try Apple Photos pattern
-                            photo_name = path.stem
-                            if photo_name.startswith('IMG_'):
-                                number_part = photo_name[4:]
-                                aae_name = f"IMG_O{number_part}.aae"
-                                aae_path = path.parent / aae_name
-                                if not aae_path.exists():
-                                    aae_name = f"IMG_O{number_part}.AAE"
-                                    aae_path = path.parent / aae_name
-                                    
-                        if aae_path.exists():
-                            aae_path.unlink()
-                            log_info(f"  Deleted AAE: {aae_path}")
+                        self._delete_associated_files(path, sidecars)
                             
                         self.stats.duplicate_files_discarded += 1
                         
@@ -1142,7 +1547,24 @@ class PhotoExporter:
             
         return files_to_keep
 
-    def _delete_duplicates_from_output(self, duplicates: Dict[str, List[Path]]) -> List[Path]:
+    def _delete_associated_files(self, path: Path, sidecars: SidecarIndex):
+        """
+        Delete the XMP and AAE sidecars of a deleted duplicate.
+        
+        Args:
+            path: Path of the deleted photo
+            sidecars: Sidecar index for the directories being cleaned
+        """
+        for label, sidecar_path in (('XMP', sidecars.find_xmp(path)), ('AAE', sidecars.find_aae(path))):
+            if sidecar_path is None:
+                continue
+            try:
+                sidecar_path.unlink()
+            except FileNotFoundError:
+                continue  # Shared with a duplicate deleted earlier in this pass
+            log_info(f"  Deleted {label}: {sidecar_path}")
+
+    def _delete_duplicates_from_output(self, duplicates: Dict[DuplicateKey, List[Path]]) -> List[Path]:
         """Delete duplicate files from output directory, keeping only the first occurrence"""
         if not duplicates:
             log_info("No duplicates found to delete")
@@ -1162,6 +1584,8 @@ class PhotoExporter:
         
         files_to_keep = []
         files_to_delete = []
+        # Sidecars are looked up in one listing per directory, taken fresh for this pass
+        sidecars = SidecarIndex()
         
         for filename, paths in duplicates.items():
             if len(paths) <= 1:
@@ -1183,36 +1607,7 @@ class PhotoExporter:
                         log_info(f"  Deleted: {path}")
                         
                         # Also delete associated XMP and AAE files
-                        xmp_path = path.with_suffix(path.suffix + '.xmp')
-                        if not xmp_path.exists():
-                            xmp_path = path.with_suffix(path.suffix + '.XMP')
-                        if not xmp_path.exists():
-                            xmp_path = path.with_suffix('.xmp')
-                        if not xmp_path.exists():
-                            xmp_path = path.with_suffix('.XMP')
-                            
-                        if xmp_path.exists():
-                            xmp_path.unlink()
-                            log_info(f"  Deleted XMP: {xmp_path}")
-                            
-                        # Delete AAE file
-                        aae_path = path.with_suffix('.aae')
-                        if not aae_path.exists():
-                            aae_path = path.with_suffix('.AAE')
-                        if not aae_path.exists():
-                            # Try Apple Photos pattern
-                            photo_name = path.stem
-                            if photo_name.startswith('IMG_'):
-                                number_part = photo_name[4:]
-                                aae_name = f"IMG_O{number_part}.aae"
-                                aae_path = path.parent / aae_name
-                                if not aae_path.exists():
-                                    aae_name = f"IMG_O{number_part}.AAE"
-                                    aae_path = path.parent / aae_name
-                                    
-                        if aae_path.exists():
-                            aae_path.unlink()
-                            log_info(f"  Deleted AAE: {aae_path}")
+                        self._delete_associated_files(path, sidecars)
                             
                         self.stats.duplicate_files_discarded += 1
                         
@@ -1250,16 +1645,11 @@ class PhotoExporter:
             return
             
         # Find export directory with photos (not empty)
+        processable_formats = self.config.file_formats.PROCESSABLE_FORMATS
         export_dir_with_photos = None
         for export_dir in sorted(export_dirs, key=lambda x: x.stat().st_mtime, reverse=True):
             # Check if this directory has photo files
-            photo_files = []
-            for file_path in export_dir.rglob("*"):
-                if file_path.is_file() and not file_path.name.startswith('.'):
-                    if self._is_supported_format(file_path):
-                        if file_path.suffix.lower() in self.supported_image_formats | self.supported_video_formats:
-                            photo_files.append(file_path)
-            if photo_files:
+            if next(self._iter_processable_files(export_dir, processable_formats), None) is not None:
                 export_dir_with_photos = export_dir
                 break
                 
@@ -1270,14 +1660,7 @@ class PhotoExporter:
         log_info(f"Using export directory: {export_dir_with_photos}")
         
         # Find all photo files in the export directory
-        all_files = list(export_dir_with_photos.rglob("*"))
-        photo_files = []
-        
-        for file_path in all_files:
-            if file_path.is_file() and not file_path.name.startswith('.'):
-                if self._is_supported_format(file_path):
-                    if file_path.suffix.lower() in self.supported_image_formats | self.supported_video_formats:
-                        photo_files.append(file_path)
+        photo_files = list(self._iter_processable_files(export_dir_with_photos, processable_formats))
         
         if not photo_files:
             log_warning("No supported photo files found in export directory")
@@ -1312,14 +1695,8 @@ class PhotoExporter:
         log_warning("=" * 60)
         
         # Find all photo files
-        all_files = list(self.source_dir.rglob("*"))
-        photo_files = []
-        
-        for file_path in all_files:
-            if file_path.is_file() and not file_path.name.startswith('.'):
-                if self._is_supported_format(file_path):
-                    if file_path.suffix.lower() in self.supported_image_formats | self.supported_video_formats:
-                        photo_files.append(file_path)
+        processable_formats = self.config.file_formats.PROCESSABLE_FORMATS
+        photo_files = list(self._iter_processable_files(self.source_dir, processable_formats))
         
         if not photo_files:
             log_warning("No supported photo files found in source directory")
@@ -1392,18 +1769,23 @@ class PhotoExporter:
                 'failed_exports': self.stats.failed_exports,
                 'duplicates_handled': self.stats.duplicates_handled,
                 'total_size_bytes': self.stats.total_size_bytes,
-                'supported_formats': dict(self.stats.supported_formats),
-                'unsupported_formats': dict(self.stats.unsupported_formats),
+                # Counters serialize as plain objects, no copy needed
+                'supported_formats': self.stats.supported_formats,
+                'unsupported_formats': self.stats.unsupported_formats,
                 'errors': self.stats.errors
-            },
-            'file_timestamps': dict(self.file_timestamps)
+            }
         }
         
         # Use timestamped filename in target directory
         timestamp = getattr(self, 'export_timestamp', datetime.now().strftime(self.config.date_formats.FILENAME_TIMESTAMP))
         metadata_file = self.target_dir / f'{timestamp}_metadata.json'
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            metadata_file.write_bytes(orjson.dumps(
+                metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+        else:
+            with open(metadata_file, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, indent=2, ensure_ascii=False)
         
         # Create summary file
         summary_file = self.target_dir / f'{timestamp}_summary.txt'
@@ -1423,7 +1805,7 @@ class PhotoExporter:
             f.write(f"Duplicate Files Found: {self.stats.duplicate_files_found}\n")
             f.write(f"Duplicate Files Resolved: {self.stats.duplicate_files_resolved}\n")
             f.write(f"Files Skipped (Duplicates): {self.stats.files_skipped_duplicates}\n")
-            f.write(f"Total Size: {self.stats.total_size_bytes / (1024*1024*1024):.2f} GB\n\n")
+            f.write(f"Total Size: {self.stats.total_size_bytes / _GIB:.2f} GB\n\n")
             
             f.write("Supported Formats:\n")
             for fmt, count in self.stats.supported_formats.most_common():
@@ -1431,11 +1813,12 @@ class PhotoExporter:
             
             if self.stats.unsupported_formats:
                 # Filter out XMP files from unsupported formats display
-                filtered_unsupported = {fmt: count for fmt, count in self.stats.unsupported_formats.items() 
-                                      if fmt.lower() not in ['.xmp']}
+                # (extensions are stored lowercased, unary + copies the Counter)
+                filtered_unsupported = +self.stats.unsupported_formats
+                filtered_unsupported.pop('.xmp', None)
                 if filtered_unsupported:
                     f.write("\nUnsupported Formats:\n")
-                    for fmt, count in sorted(filtered_unsupported.items()):
+                    for fmt, count in filtered_unsupported.most_common():
                         f.write(f"  {fmt}: {count}\n")
             
             if self.stats.errors:
@@ -1467,25 +1850,52 @@ class PhotoExporter:
         
         # Find all files (supported and unsupported) - recursively scan subdirectories
         all_files = list(self.source_dir.rglob("*"))
+        # The scan already lists every source directory; sidecar lookups reuse it
+        self.sidecars.prime(all_files)
+        if not self._batch_size:
+            self.batch_size = min(
+                self.config.processing.DEFAULT_BATCH_SIZE,
+                max(self.config.processing.MIN_BATCH_SIZE, len(all_files) // 10)
+            )
         photo_files = []
+        # Sizes from the scan's stat, reused for duplicate detection and the disk space check
+        file_sizes: Dict[Path, int] = {}
+        file_stats: Dict[Path, os.stat_result] = {}
+        processable_formats = self.config.file_formats.PROCESSABLE_FORMATS
+        search_supported_suffix = self.supported_suffix_pattern.search
+        unsupported_extensions = []
+        warned_extensions = set()
         
         for file_path in all_files:
-            if file_path.is_file() and not file_path.name.startswith('.'):
-                if self._is_supported_format(file_path):
+            name = file_path.name
+            if name.startswith('.'):
+                continue
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
+                match = search_supported_suffix(name)
+                if match:
                     # Add photos/videos for processing
-                    if file_path.suffix.lower() in self.supported_image_formats | self.supported_video_formats:
+                    if '.' + match.group(1).lower() in processable_formats:
                         photo_files.append(file_path)
+                        file_sizes[file_path] = file_stat.st_size
+                        file_stats[file_path] = file_stat
                     # AAE files will be processed alongside their corresponding photos
                     # No need to add them to photo_files as they're handled in _process_photo()
                 else:
-                    # Process unsupported file for statistics
-                    self.stats.total_files_processed += 1
+                    # Collect unsupported file for statistics
                     ext = self._get_file_extension(file_path)
-                    self.stats.unsupported_formats[ext] += 1
+                    unsupported_extensions.append(ext)
                     
-                    # Don't warn about XMP files as they are expected
-                    if ext.lower() not in ['.xmp']:
-                        log_warning(f"Unsupported format: {file_path}")
+                    # Warn once per extension; don't warn about XMP files as they are expected
+                    if ext not in warned_extensions and ext != '.xmp':
+                        warned_extensions.add(ext)
+                        log_warning(f"Unsupported format: {file_path} (further {ext or 'extensionless'} files not logged)")
+        
+        self.stats.total_files_processed += len(unsupported_extensions)
+        self.stats.unsupported_formats.update(unsupported_extensions)
         
         log_info(f"📸 Found {len(photo_files)} photo files to process")
 
@@ -1494,34 +1904,22 @@ class PhotoExporter:
             return False
         
         # Detect and handle duplicates
-        duplicates = self.duplicate_handler.detect_duplicates(photo_files)
+        duplicates = self.duplicate_handler.detect_duplicates(photo_files, file_sizes)
         if duplicates:
             log_info(f"Duplicate strategy: {self.duplicate_strategy}")
             duplicate_files_to_process = self.duplicate_handler.handle_duplicates(duplicates)
             
-            if self.duplicate_strategy == 'skip_duplicates':
-                # Remove all duplicate files from processing
-                all_duplicate_files = []
-                for paths in duplicates.values():
-                    all_duplicate_files.extend(paths)
-                photo_files = [f for f in photo_files if f not in all_duplicate_files]
-            elif self.duplicate_strategy == 'preserve_duplicates':
-                # Remove duplicate files from processing list and add back resolved files
-                all_duplicate_files = []
-                for paths in duplicates.values():
-                    all_duplicate_files.extend(paths)
-                photo_files = [f for f in photo_files if f not in all_duplicate_files]
+            # Remove all duplicate files from processing (set for O(1) membership)
+            all_duplicate_files = set().union(*duplicates.values())
+            photo_files = [f for f in photo_files if f not in all_duplicate_files]
+            
+            if self.duplicate_strategy != 'skip_duplicates':
+                # Add back resolved files
                 photo_files.extend(duplicate_files_to_process)
-                
+            
+            if self.duplicate_strategy == 'preserve_duplicates':
                 # Store duplicates for later processing
                 self.duplicates_to_preserve = self.duplicate_handler.duplicates_to_preserve
-            else:
-                # Remove duplicate files from processing list and add back resolved files
-                all_duplicate_files = []
-                for paths in duplicates.values():
-                    all_duplicate_files.extend(paths)
-                photo_files = [f for f in photo_files if f not in all_duplicate_files]
-                photo_files.extend(duplicate_files_to_process)
             
             log_info(f"After duplicate handling: {len(photo_files)} files to process")
             
@@ -1530,7 +1928,7 @@ class PhotoExporter:
         
         # Calculate total size for disk space check (only in dry run)
         if self.is_dry_run:
-            total_size = sum(photo_path.stat().st_size for photo_path in photo_files)
+            total_size = sum(file_sizes[photo_path] for photo_path in photo_files)
             log_info(f"💾 Checking disk space...")
             
             # Check disk space using target directory (not export directory which doesn't exist in dry run)
@@ -1558,21 +1956,53 @@ class PhotoExporter:
             if processed % 50 == 0:  # Log every 50 files
                 log_debug(f"Processed {processed}/{total} files ({processed/total*100:.1f}%)")
         
+        # EXIF dates are read for non-HEIC images (HEIC dates come from XMP)
+        exif_formats = self.supported_image_formats - {'.heic'}
+        exif_images = [p for p in photo_files if self._get_file_extension(p) in exif_formats]
+        
+        # Reuse EXIF dates of unchanged photos from earlier runs
+        metadata_cache = MetadataCache.open(self.config.processing.METADATA_CACHE_FILE, read_only=self.is_dry_run)
+        if metadata_cache is not None:
+            self._cached_exif_dates = metadata_cache.load(
+                {str(p): (file_stats[p].st_size, file_stats[p].st_mtime_ns) for p in exif_images}
+            )
+            log_debug(f"Metadata cache: {len(self._cached_exif_dates)}/{len(exif_images)} EXIF dates cached")
+        
+        # Read EXIF dates of large libraries in bulk when exiftool is installed
+        self._prefetch_exif_dates(exif_images)
+        
         # Choose processing method based on dataset size
         use_streaming = len(photo_files) > 1000 and self.memory_optimization_enabled
         
         if use_streaming:
-            log_info(f"Using streaming processing for {len(photo_files)} files (memory optimization enabled)")
-            # Use streaming processing for large datasets
-            batch_results = self._stream_process_files(photo_files, self._process_photo_worker)
+            log_info(f"Using process pool for {len(photo_files)} files (memory optimization enabled)")
+            # Metadata extraction is CPU bound, so large datasets use processes
+            batch_results = self._process_cpu_bound(photo_files, progress_callback, file_stats)
         else:
-            # Use batch processing for smaller datasets
+            # Use batch processing for smaller datasets; workers reuse the scan's stat
+            def process_photo(photo_path: Path) -> Optional[PhotoMetadata]:
+                return self._process_photo_worker(photo_path, file_stats.get(photo_path))
+            
             batch_results = self._process_files_in_batches(
                 photo_files, 
-                self._process_photo_worker, 
+                process_photo, 
                 progress_callback
             )
         
+        if metadata_cache is not None:
+            # Dry runs only read the cache; only successfully parsed dates are stored
+            if not self.is_dry_run:
+                metadata_cache.store(
+                    (r.original_path, r.file_size, r.mtime_ns, r.exif_date.isoformat() if r.exif_date else None)
+                    for r in batch_results
+                    if r is not None and r.is_valid and r.exif_parsed
+                    and r.original_path not in self._cached_exif_dates
+                )
+            metadata_cache.close()
+        
+        # Copy in date order so all files of the same day land consecutively
+        batch_results.sort(key=self._copy_order_key)
+        
         # Process results with progress bar
         progress_desc = "🐍 DRY-RUN Simulation" if self.is_dry_run else "📸 Processing Photos"
         with tqdm(total=len(photo_files), desc=progress_desc, unit="file", 
@@ -1610,6 +2040,11 @@ class PhotoExporter:
                     if result and hasattr(result, 'error_message') and result.error_message:
                         self.stats.errors.append(result.error_message)
         
+        # Tally formats once from the collected results; workers never touch the stats
+        self.stats.supported_formats.update(
+            result.file_extension for result in batch_results if result is not None and result.is_valid
+        )
+        
         # Process preserved duplicates if using preserve_duplicates strategy
         if self.duplicate_strategy == 'preserve_duplicates' and self.duplicates_to_preserve:
             self._process_preserved_duplicates()
@@ -1633,38 +2068,44 @@ class PhotoExporter:
 
     def _print_summary(self):
         """Print export summary"""
-        log_info("\n" + "=" * 60)
-        log_info("📊 EXPORT SUMMARY")
-        log_info(f"   📸 Photos: {self.stats.photos_processed} processed, {self.stats.successful_exports} successful")
-        log_info(f"   📄 XMP files: {self.stats.xmp_files_processed}")
-        log_info(f"   🎨 AAE files: {self.stats.aae_files_processed}")
-        log_info(f"   🔄 Duplicates: {self.stats.duplicate_files_found} found, {self.stats.duplicates_handled} handled")
-        log_info(f"   💾 Total size: {self.stats.total_size_bytes / (1024*1024*1024):.2f} GB")
+        # Compose the summary and emit it with one logger call per level
+        lines = [
+            "\n" + "=" * 60,
+            "📊 EXPORT SUMMARY",
+            f"   📸 Photos: {self.stats.photos_processed} processed, {self.stats.successful_exports} successful",
+            f"   📄 XMP files: {self.stats.xmp_files_processed}",
+            f"   🎨 AAE files: {self.stats.aae_files_processed}",
+            f"   🔄 Duplicates: {self.stats.duplicate_files_found} found, {self.stats.duplicates_handled} handled",
+            f"   💾 Total size: {self.stats.total_size_bytes / _GIB:.2f} GB",
+        ]
         
         if self.stats.supported_formats:
-            log_info("\nSupported Formats:")
-            for fmt, count in self.stats.supported_formats.most_common():
-                log_info(f"  {fmt}: {count}")
+            lines.append("\nSupported Formats:")
+            lines.extend(f"  {fmt}: {count}" for fmt, count in self.stats.supported_formats.most_common())
         
         if self.stats.unsupported_formats:
             # Filter out XMP files from unsupported formats display
-            filtered_unsupported = {fmt: count for fmt, count in self.stats.unsupported_formats.items() 
-                                  if fmt.lower() not in ['.xmp']}
+            # (extensions are stored lowercased, unary + copies the Counter)
+            filtered_unsupported = +self.stats.unsupported_formats
+            filtered_unsupported.pop('.xmp', None)
             if filtered_unsupported:
-                log_info("\nUnsupported Formats:")
-                for fmt, count in sorted(filtered_unsupported.items()):
-                    log_info(f"  {fmt}: {count}")
+                lines.append("\nUnsupported Formats:")
+                lines.extend(f"  {fmt}: {count}" for fmt, count in filtered_unsupported.most_common())
         
-        if self.stats.errors:
-            log_warning(f"\nErrors ({len(self.stats.errors)}):")
-            for error in self.stats.errors[:10]:  # Show first 10 errors
-                log_warning(f"  - {error}")
-            if len(self.stats.errors) > 10:
-                log_warning(f"  ... and {len(self.stats.errors) - 10} more errors")
+        log_info("\n".join(lines))
+        
+        errors = self.stats.errors
+        if errors:
+            error_count = len(errors)
+            error_lines = [f"\nErrors ({error_count}):"]
+            error_lines.extend(f"  - {error}" for error in islice(errors, 10))  # Show first 10 errors
+            if error_count > 10:
+                error_lines.append(f"  ... and {error_count - 10} more errors")
+            log_warning("\n".join(error_lines))
         
         if self.is_dry_run:
-            log_info(f"\n🐍 DRY-RUN COMPLETED - No files were actually copied")
-            log_info(f"   To execute the export, run with 'run' parameter")
+            log_info(f"\n🐍 DRY-RUN COMPLETED - No files were actually copied\n"
+                     f"   To execute the export, run with 'run' parameter")
         else:
             log_info(f"\n✅ EXPORT COMPLETED - Files saved to: {self.export_dir.name}")
     
@@ -1737,6 +2178,42 @@ class PhotoExporter:
             log_error(f"Error saving performance metrics: {e}")
 
 
+# Per-process exporter used by _extract_metadata_batch, set by _init_metadata_worker
+_metadata_worker_exporter: Optional[PhotoExporter] = None
+
+
+def _init_metadata_worker(debug: bool, exiftool_dates: Dict[str, Dict[int, Any]],
+                          cached_exif_dates: Dict[str, Optional[datetime]],
+                          sidecar_listings: Dict[str, SidecarNames]):
+    """Process pool initializer: create the metadata-only exporter for this process"""
+    global _metadata_worker_exporter
+    # Metadata extraction only needs the configuration, so __init__ (path
+    # validation, monitors, duplicate handler) is skipped
+    exporter = PhotoExporter.__new__(PhotoExporter)
+    exporter._debug = debug
+    exporter.sidecars = SidecarIndex(listings=sidecar_listings)
+    exporter._exiftool_dates = exiftool_dates
+    exporter._cached_exif_dates = cached_exif_dates
+    _metadata_worker_exporter = exporter
+
+
+def _extract_metadata_batch(jobs: List[Tuple[Path, Optional[os.stat_result]]]
+                            ) -> List[Tuple[Optional[PhotoMetadata], float]]:
+    """
+    Process pool entry point (module level so it can be pickled).
+    
+    Jobs are (path, scan stat) pairs. Each result is returned with the
+    seconds it took, so the parent can record the timing in its monitor.
+    """
+    exporter = _metadata_worker_exporter
+    timed_results = []
+    for photo_path, file_stat in jobs:
+        start = time.perf_counter()
+        metadata = exporter._process_photo_worker(photo_path, file_stat)
+        timed_results.append((metadata, time.perf_counter() - start))
+    return timed_results
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -1761,7 +2238,7 @@ Examples:
     args = parser.parse_args()
     
     # Convert string to boolean
-    is_dry_run = args.is_dry_run.lower() in ('true', '1', 'yes', 'on')
+    is_dry_run = args.is_dry_run.strip().lower() in _TRUTHY
     
     try:
         # Setup logging
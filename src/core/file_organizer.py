@@ -6,21 +6,175 @@ This module handles file organization, directory structure creation,
 filename generation, and file copying operations.
 """
 
+import os
 import shutil
+import ctypes
+import ctypes.util
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from itertools import islice
 
 # Add the project root to the Python path
 import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.logging.logger_config import log_info, log_warning, log_debug, log_error
+from src.logging.logger_config import log_info, log_warning, log_debug, log_error, is_debug_enabled
 from src.security.security_utils import create_safe_path, sanitize_filename, SecurityError
 from src.core.metadata_extractor import PhotoMetadata
 from src.core.config import get_config
+from src.utils.file_utils import aae_candidate_names, xmp_candidate_names
+
+# APFS copy-on-write clones (macOS) - constant time regardless of file size
+_clonefile = None
+if sys.platform == 'darwin':
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library('c') or '/usr/lib/libSystem.dylib', use_errno=True)
+        _clonefile = _libc.clonefile
+        _clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+        _clonefile.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _clonefile = None
+
+# In-kernel copy (Linux) - reflinks on Btrfs/XFS, no user-space buffers elsewhere
+_copy_file_range = getattr(os, 'copy_file_range', None)
+
+
+def _copy_with_file_range(source_path: Path, target_path: Path) -> None:
+    """
+    Copy file content with os.copy_file_range.
+    
+    Args:
+        source_path: Source file path
+        target_path: Target file path
+        
+    Raises:
+        OSError: If the kernel or filesystem does not support the call
+    """
+    with open(source_path, 'rb') as fsrc, open(target_path, 'wb') as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        remaining = os.fstat(infd).st_size
+        while remaining > 0:
+            copied = _copy_file_range(infd, outfd, remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+
+
+# Sidecar names of one directory: (XMP names, AAE names)
+SidecarNames = Tuple[FrozenSet[str], FrozenSet[str]]
+
+
+class SidecarIndex:
+    """
+    Finds XMP and AAE sidecars from cached directory listings.
+    
+    Each source directory is listed once with os.scandir, and sidecar
+    candidates are then checked against the listed names instead of
+    issuing an exists() stat per candidate name. Listed names are split
+    into XMP and AAE names up front, so photos in directories without
+    sidecars of a kind skip building candidate names for it. At most
+    max_directories listings are kept; the oldest is dropped first, which
+    suits the directory-by-directory order files are scanned in.
+    """
+    
+    def __init__(self, max_directories: int = 1024,
+                 listings: Optional[Dict[str, SidecarNames]] = None):
+        self._listings: Dict[str, SidecarNames] = dict(listings) if listings else {}
+        self.max_directories = max_directories
+    
+    @property
+    def listings(self) -> Dict[str, SidecarNames]:
+        """Directory listings held so far, e.g. to hand to worker processes."""
+        return self._listings
+    
+    def prime(self, paths: Iterable[Path]):
+        """
+        Take directory listings from an existing recursive scan.
+        
+        Every entry of a scanned directory is in the scan, so the names can
+        be grouped by parent directory instead of listing each one again.
+        
+        Args:
+            paths: All paths found by the scan (e.g. from rglob)
+        """
+        listings: Dict[str, List[str]] = defaultdict(list)
+        for path in paths:
+            directory, name = os.path.split(os.fspath(path))
+            listings[directory].append(name)
+        
+        self._listings.clear()
+        for directory, names in islice(listings.items(), self.max_directories):
+            self._listings[directory] = self._classify(names)
+    
+    @staticmethod
+    def _classify(names: Iterable[str]) -> SidecarNames:
+        """Split directory entry names into XMP and AAE names."""
+        xmp_names, aae_names = [], []
+        for name in names:
+            extension = name[-4:].lower()
+            if extension == '.xmp':
+                xmp_names.append(name)
+            elif extension == '.aae':
+                aae_names.append(name)
+        return frozenset(xmp_names), frozenset(aae_names)
+    
+    def _sidecars_in(self, directory: str) -> SidecarNames:
+        """Get the sidecar names of a directory, listing it on first use."""
+        sidecars = self._listings.get(directory)
+        if sidecars is None:
+            try:
+                with os.scandir(directory or '.') as entries:
+                    sidecars = self._classify(entry.name for entry in entries)
+            except OSError:
+                sidecars = (frozenset(), frozenset())
+            if len(self._listings) >= self.max_directories:
+                del self._listings[next(iter(self._listings))]
+            self._listings[directory] = sidecars
+        return sidecars
+    
+    @staticmethod
+    def _first_existing(directory: str, names: FrozenSet[str], candidates: Tuple[str, ...]) -> Optional[Path]:
+        """Return the first candidate name present in names."""
+        for candidate in candidates:
+            if candidate in names:
+                return Path(directory, candidate)
+        return None
+    
+    def find_xmp(self, photo_path: Path) -> Optional[Path]:
+        """
+        Find the XMP sidecar of a photo.
+        
+        Args:
+            photo_path: Path to the photo file
+            
+        Returns:
+            Path to XMP file if found, None otherwise
+        """
+        # Split as a plain string; only a found sidecar becomes a Path
+        directory, name = os.path.split(os.fspath(photo_path))
+        xmp_names = self._sidecars_in(directory)[0]
+        if not xmp_names:
+            return None
+        return self._first_existing(directory, xmp_names, xmp_candidate_names(name))
+    
+    def find_aae(self, photo_path: Path) -> Optional[Path]:
+        """
+        Find the AAE (Apple Adjustment Export) sidecar of a photo.
+        
+        Args:
+            photo_path: Path to the photo file
+            
+        Returns:
+            Path to AAE file if found, None otherwise
+        """
+        directory, name = os.path.split(os.fspath(photo_path))
+        aae_names = self._sidecars_in(directory)[1]
+        if not aae_names:
+            return None
+        return self._first_existing(directory, aae_names, aae_candidate_names(name))
 
 
 class FileOrganizer:
@@ -34,26 +188,41 @@ class FileOrganizer:
     - Handle filename conflicts and duplicates
     """
     
-    def __init__(self, export_dir: Path, is_dry_run: bool = True):
+    def __init__(self, export_dir: Path, is_dry_run: bool = True,
+                 sidecars: Optional[SidecarIndex] = None):
         """
         Initialize the file organizer.
         
         Args:
             export_dir: Base export directory
             is_dry_run: Whether to simulate operations without actually copying files
+            sidecars: Sidecar index to share with the caller (a new one by default)
         """
         self.export_dir = export_dir
         self.is_dry_run = is_dry_run
-        self.file_timestamps: dict = defaultdict(int)
+        self.sidecars = sidecars or SidecarIndex()
+        self._devices: Dict[str, int] = {}
+        # Filename counter of the main pass, which copies photos in date order:
+        # only the current day is kept, timestamps of different days never collide
+        self._day_key: Optional[Tuple[int, int, int]] = None
+        self._day_counter: Counter = Counter()
+        # Duplicates arrive out of date order and are numbered separately
+        self._duplicate_counter: Counter = Counter()
+        # Last directory created, photos are copied grouped by date
+        self._last_dir_key: Optional[int] = None
+        self._last_dir_path: Optional[Path] = None
         self.config = get_config()
         
-    def generate_filename(self, creation_date: datetime, extension: str) -> str:
+    def generate_filename(self, creation_date: datetime, extension: str,
+                          counter: Optional[Counter] = None) -> str:
         """
         Generate filename in format YYYYMMDD-HHMMSS-SSS.ext.
         
         Args:
             creation_date: Creation date of the file
             extension: File extension (e.g., '.heic', '.mov')
+            counter: Timestamp counter to number with; defaults to the
+                current day's counter of the date-ordered main pass
             
         Returns:
             Generated filename with timestamp and extension
@@ -62,17 +231,38 @@ class FileOrganizer:
         base_timestamp = creation_date.strftime(self.config.date_formats.FILENAME_TIMESTAMP)
         
         # Add milliseconds if available, otherwise use counter
-        if creation_date.microsecond > 0:
-            milliseconds = str(creation_date.microsecond // 1000).zfill(3)
+        microsecond = creation_date.microsecond
+        if microsecond > 0:
+            milliseconds = microsecond // 1000
         else:
             # Use counter for same timestamp
-            self.file_timestamps[base_timestamp] += 1
-            milliseconds = str(self.file_timestamps[base_timestamp]).zfill(3)
+            if counter is None:
+                counter = self._get_day_counter(creation_date)
+            milliseconds = counter[base_timestamp] = counter[base_timestamp] + 1
         
         # Sanitize the filename
-        filename = f"{base_timestamp}-{milliseconds}{extension}"
+        filename = f"{base_timestamp}-{milliseconds:03d}{extension}"
         return sanitize_filename(filename)
 
+    def _get_day_counter(self, creation_date: datetime) -> Counter:
+        """
+        Get the timestamp counter for the day of the given date.
+        
+        The previous day's counter is dropped when the day changes, which
+        keeps memory bounded as the main pass copies photos in date order.
+        
+        Args:
+            creation_date: Creation date of the file
+            
+        Returns:
+            Counter of timestamps seen for that day
+        """
+        day_key = (creation_date.year, creation_date.month, creation_date.day)
+        if day_key != self._day_key:
+            self._day_key = day_key
+            self._day_counter = Counter()
+        return self._day_counter
+
     def create_directory_structure(self, year: int, month: int, day: int) -> Path:
         """
         Create YEAR directory structure (flat structure).
@@ -91,6 +281,10 @@ class FileOrganizer:
         if self.export_dir is None:
             raise ValueError("Export directory not set")
         
+        # Same directory as the previous photo - already created
+        if year == self._last_dir_key and self._last_dir_path is not None:
+            return self._last_dir_path
+        
         # Use secure path creation
         try:
             dir_path = create_safe_path(self.export_dir, str(year))
@@ -101,6 +295,8 @@ class FileOrganizer:
         if not self.is_dry_run:
             dir_path.mkdir(parents=True, exist_ok=True)
         
+        self._last_dir_key = year
+        self._last_dir_path = dir_path
         return dir_path
 
     def copy_photo_with_metadata(self, metadata: PhotoMetadata, target_dir: Path) -> bool:
@@ -128,16 +324,18 @@ class FileOrganizer:
 
             if self.is_dry_run:
                 # Dry run mode - just log what would be done
-                log_debug(f"DRY-RUN: Would copy: {metadata.original_filename} -> {target_path}")
-                
-                # Log associated files that would be copied
-                self._log_associated_files(metadata.original_path, target_path)
+                if is_debug_enabled():
+                    log_debug(f"DRY-RUN: Would copy: {metadata.original_filename} -> {target_path}")
+                    
+                    # Log associated files that would be copied
+                    self._log_associated_files(metadata.original_path, target_path)
                 
                 return True
             else:
                 # Real mode - actually copy the file
-                shutil.copy2(metadata.original_path, target_path)
-                log_debug(f"Copied: {metadata.original_filename} -> {target_path}")
+                self._copy_file(metadata.original_path, target_path, metadata.atime_ns, metadata.mtime_ns)
+                if is_debug_enabled():
+                    log_debug(f"Copied: {metadata.original_filename} -> {target_path}")
                 
                 # Copy associated files
                 self._copy_associated_files(metadata.original_path, target_path, target_dir)
@@ -171,14 +369,15 @@ class FileOrganizer:
             if not self.is_dry_run:
                 target_dir.mkdir(parents=True, exist_ok=True)
             
-            new_filename = self.generate_filename(metadata.creation_date, metadata.file_extension)
+            new_filename = self.generate_filename(metadata.creation_date, metadata.file_extension,
+                                                  self._duplicate_counter)
             target_path = target_dir / new_filename
 
             # Handle potential filename duplicates
             target_path = self._resolve_filename_conflict(target_path)
 
             if not self.is_dry_run:
-                shutil.copy2(metadata.original_path, target_path)
+                self._copy_file(metadata.original_path, target_path, metadata.atime_ns, metadata.mtime_ns)
                 log_debug(f"Copied duplicate: {metadata.original_filename} -> {target_path}")
             else:
                 log_debug(f"Would copy duplicate: {metadata.original_filename} -> {target_path}")
@@ -193,6 +392,75 @@ class FileOrganizer:
             log_error(error_msg)
             return False
 
+    def _copy_file(self, source_path: Path, target_path: Path,
+                   atime_ns: Optional[int] = None, mtime_ns: Optional[int] = None):
+        """
+        Copy file content and preserve its access and modification times.
+        
+        Lighter than shutil.copy2, which also copies mode bits and flags and
+        stats the source again. Known source times are reused without a stat.
+        
+        Args:
+            source_path: Source file path
+            target_path: Target file path
+            atime_ns: Source access time in nanoseconds, if already known
+            mtime_ns: Source modification time in nanoseconds, if already known
+        """
+        self._fast_copy(source_path, target_path)
+        if atime_ns is None or mtime_ns is None:
+            source_stat = os.stat(source_path)
+            atime_ns, mtime_ns = source_stat.st_atime_ns, source_stat.st_mtime_ns
+        os.utime(target_path, ns=(atime_ns, mtime_ns))
+
+    def _fast_copy(self, source_path: Path, target_path: Path):
+        """
+        Copy file content, cloning it when source and target share a filesystem.
+        
+        Uses clonefile on macOS and copy_file_range on Linux for same-device
+        copies, falling back to shutil.copyfile when neither applies or the
+        filesystem rejects the call.
+        
+        Args:
+            source_path: Source file path
+            target_path: Target file path (must not exist yet)
+        """
+        if self._same_device(os.path.dirname(source_path), os.path.dirname(target_path)):
+            if _clonefile is not None:
+                if _clonefile(os.fsencode(source_path), os.fsencode(target_path), 0) == 0:
+                    return
+            elif _copy_file_range is not None:
+                try:
+                    _copy_with_file_range(source_path, target_path)
+                    return
+                except OSError:
+                    pass
+        shutil.copyfile(source_path, target_path)
+
+    def _same_device(self, source_dir: str, target_dir: str) -> bool:
+        """
+        Check whether two directories are on the same device.
+        
+        Device IDs are stat'ed once per directory and cached.
+        
+        Args:
+            source_dir: Source directory
+            target_dir: Target directory
+            
+        Returns:
+            True if both directories are on the same device, False otherwise
+        """
+        devices = self._devices
+        device_ids = []
+        for directory in (source_dir, target_dir):
+            device = devices.get(directory)
+            if device is None:
+                try:
+                    device = devices[directory] = os.stat(directory or '.').st_dev
+                except OSError:
+                    return False
+            device_ids.append(device)
+        return device_ids[0] == device_ids[1]
+
     def _resolve_filename_conflict(self, target_path: Path) -> Path:
         """
         Resolve filename conflicts by adding a counter.
@@ -252,16 +520,18 @@ class FileOrganizer:
         if xmp_path:
             xmp_filename = target_path.stem + '.xmp'
             xmp_target_path = target_dir / xmp_filename
-            shutil.copy2(xmp_path, xmp_target_path)
-            log_debug(f"Copied XMP: {xmp_path.name} -> {xmp_target_path}")
+            self._copy_file(xmp_path, xmp_target_path)
+            if is_debug_enabled():
+                log_debug(f"Copied XMP: {xmp_path.name} -> {xmp_target_path}")
         
         # Copy AAE file
         aae_path = self._find_aae_file(original_path)
         if aae_path:
             aae_filename = target_path.stem + '.aae'
             aae_target_path = target_dir / aae_filename
-            shutil.copy2(aae_path, aae_target_path)
-            log_debug(f"Copied AAE: {aae_path.name} -> {aae_target_path}")
+            self._copy_file(aae_path, aae_target_path)
+            if is_debug_enabled():
+                log_debug(f"Copied AAE: {aae_path.name} -> {aae_target_path}")
 
     def _find_xmp_file(self, photo_path: Path) -> Optional[Path]:
         """
@@ -277,19 +547,7 @@ class FileOrganizer:
         if isinstance(photo_path, str):
             photo_path = Path(photo_path)
         
-        # Try different XMP file patterns
-        xmp_patterns = [
-            photo_path.with_suffix(photo_path.suffix + '.xmp'),
-            photo_path.with_suffix(photo_path.suffix + '.XMP'),
-            photo_path.with_suffix('.xmp'),
-            photo_path.with_suffix('.XMP')
-        ]
-        
-        for xmp_path in xmp_patterns:
-            if xmp_path.exists():
-                return xmp_path
-        
-        return None
+        return self.sidecars.find_xmp(photo_path)
 
     def _find_aae_file(self, photo_path: Path) -> Optional[Path]:
         """
@@ -305,52 +563,20 @@ class FileOrganizer:
         if isinstance(photo_path, str):
             photo_path = Path(photo_path)
         
-        original_path = photo_path
-        
-        # Try standard AAE patterns
-        aae_patterns = [
-            original_path.with_suffix('.aae'),
-            original_path.with_suffix('.AAE')
-        ]
-        
-        for aae_path in aae_patterns:
-            if aae_path.exists():
-                return aae_path
-        
-        # Try Apple Photos pattern (IMG_1234.HEIC -> IMG_O1234.aae)
-        photo_name = original_path.stem
-        if photo_name.startswith('IMG_'):
-            number_part = photo_name[4:]
-            aae_patterns = [
-                original_path.parent / f"IMG_O{number_part}.aae",
-                original_path.parent / f"IMG_O{number_part}.AAE"
-            ]
-            
-            for aae_path in aae_patterns:
-                if aae_path.exists():
-                    return aae_path
-        
-        # Try numeric pattern (1470.HEIC -> 1470O.aae)
-        elif photo_name.isdigit():
-            aae_patterns = [
-                original_path.parent / f"{photo_name}O.aae",
-                original_path.parent / f"{photo_name}O.AAE"
-            ]
-            
-            for aae_path in aae_patterns:
-                if aae_path.exists():
-                    return aae_path
-        
-        return None
+        return self.sidecars.find_aae(photo_path)
 
     def set_export_directory(self, export_dir: Path):
         """Set the export directory."""
         self.export_dir = export_dir
+        self._last_dir_key = None
+        self._last_dir_path = None
 
     def set_dry_run(self, is_dry_run: bool):
         """Set dry run mode."""
         self.is_dry_run = is_dry_run
 
     def reset_timestamps(self):
-        """Reset the file timestamp counter."""
-        self.file_timestamps.clear()
+        """Reset the file timestamp counters."""
+        self._day_key = None
+        self._day_counter = Counter()
+        self._duplicate_counter = Counter()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Metadata cache module for Apple Photos Export Tool
+
+This module keeps the EXIF capture dates of already processed photos in a
+SQLite file, so repeated exports of the same library skip EXIF parsing for
+photos whose size and modification time have not changed.
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Add the project root to the Python path
+import sys
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.logging.logger_config import log_debug, log_warning
+
+# One cached photo: (path, size, mtime in nanoseconds, ISO EXIF date or None)
+CacheRow = Tuple[str, int, int, Optional[str]]
+
+# SQLite limits the number of parameters per statement
+_LOOKUP_BATCH_SIZE = 500
+
+
+class MetadataCache:
+    """
+    SQLite-backed cache of EXIF capture dates.
+
+    Entries are keyed by photo path and are only used while the photo's size
+    and modification time match the cached ones. A photo without EXIF date
+    is cached as None, so it is not parsed again either.
+    """
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    @classmethod
+    def open(cls, cache_file: str, read_only: bool = False) -> Optional['MetadataCache']:
+        """
+        Open (and create if needed) the cache file.
+
+        Args:
+            cache_file: Path to the SQLite file; '~' is expanded
+            read_only: Only use an existing cache file, never create one (dry runs)
+
+        Returns:
+            MetadataCache instance, or None if the cache is disabled or cannot be opened
+        """
+        if not cache_file:
+            return None
+
+        path = Path(os.path.expanduser(cache_file))
+        if read_only and not path.is_file():
+            return None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(path))
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS exif_dates ("
+                "path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, exif_date TEXT)"
+            )
+        except (OSError, sqlite3.Error) as e:
+            log_warning(f"Metadata cache unavailable ({e}), parsing all EXIF dates")
+            return None
+
+        log_debug(f"Using metadata cache: {path}")
+        return cls(connection)
+
+    def load(self, file_stats: Dict[str, Tuple[int, int]]) -> Dict[str, Optional[datetime]]:
+        """
+        Look up the cached EXIF dates of the given photos.
+
+        Args:
+            file_stats: Photo path -> (size, mtime in nanoseconds) from the current scan
+
+        Returns:
+            Photo path -> EXIF date (None if the photo has none), for entries still valid
+        """
+        paths = list(file_stats)
+        dates: Dict[str, Optional[datetime]] = {}
+        try:
+            for start in range(0, len(paths), _LOOKUP_BATCH_SIZE):
+                batch = paths[start:start + _LOOKUP_BATCH_SIZE]
+                rows = self._connection.execute(
+                    "SELECT path, size, mtime_ns, exif_date FROM exif_dates "
+                    f"WHERE path IN ({','.join('?' * len(batch))})",
+                    batch,
+                )
+                for path, size, mtime_ns, exif_date in rows:
+                    if file_stats[path] == (size, mtime_ns):
+                        dates[path] = datetime.fromisoformat(exif_date) if exif_date else None
+        except (sqlite3.Error, ValueError) as e:
+            log_warning(f"Could not read metadata cache: {e}")
+        return dates
+
+    def store(self, rows: Iterable[CacheRow]):
+        """
+        Store EXIF dates in a single transaction.
+
+        Args:
+            rows: (path, size, mtime in nanoseconds, ISO EXIF date or None) per photo
+        """
+        rows: List[CacheRow] = list(rows)
+        if not rows:
+            return
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO exif_dates (path, size, mtime_ns, exif_date) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            log_warning(f"Could not update metadata cache: {e}")
+
+    def close(self):
+        """Close the cache file."""
+        self._connection.close()
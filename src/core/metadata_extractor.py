@@ -43,7 +43,11 @@ except ImportError:
     raise ImportError("python-dateutil library not found. Install with: pip install python-dateutil")
 
 
-@dataclass
+# Slotted instances (3.10+) avoid a __dict__ per photo
+_SLOTS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS_OPTIONS)
 class PhotoMetadata:
     """Container for photo metadata"""
     original_path: str
@@ -53,6 +57,8 @@ class PhotoMetadata:
     date_source: str = 'unknown'
     is_valid: bool = False
     error_message: Optional[str] = None
+    atime_ns: Optional[int] = None
+    mtime_ns: Optional[int] = None
 
 
 class MetadataExtractor:
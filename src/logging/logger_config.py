@@ -21,6 +21,11 @@ import json
 from datetime import datetime
 
 
+# Whether any configured sink accepts DEBUG messages. Loguru's default handler
+# logs DEBUG, so this stays True until the logger is configured.
+_debug_enabled: bool = True
+
+
 class PhotoExportLogger:
     """Centralized logger for photo export operations"""
     
@@ -34,9 +39,17 @@ class PhotoExportLogger:
     
     def _setup_logger(self):
         """Configure Loguru logger with console and file outputs"""
+        global _debug_enabled
+        
         # Remove default handler
         logger.remove()
         
+        # File log always records DEBUG, console only when requested
+        file_level = "DEBUG"
+        sink_levels = [self.log_level, file_level] if self.log_dir else [self.log_level]
+        debug_no = logger.level("DEBUG").no
+        _debug_enabled = any(logger.level(level).no <= debug_no for level in sink_levels)
+        
         # Console output with colors - simplified format
         logger.add(
             sys.stderr,
@@ -71,7 +84,7 @@ class PhotoExportLogger:
             logger.add(
                 self.log_dir / main_log_name,
                 format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
-                level="DEBUG",
+                level=file_level,
                 rotation=None,  # Disable automatic rotation
                 retention=None,  # Disable automatic retention
                 compression=None,  # Disable compression
@@ -208,6 +221,11 @@ def setup_logging(log_dir: Optional[Path] = None, log_level: str = "INFO", times
     return _photo_logger
 
 
+def is_debug_enabled() -> bool:
+    """Check if DEBUG messages are written anywhere (guard for hot-path log_debug)"""
+    return _debug_enabled
+
+
 # Convenience functions for common logging operations
 def log_info(message: str, **kwargs):
     """Log info message with optional context"""
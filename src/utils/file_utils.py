@@ -6,6 +6,7 @@ This module provides utility functions for finding associated files
 (XMP, AAE) and other file operations.
 """
 
+import os
 import sys
 from pathlib import Path
 from typing import Optional, Tuple
@@ -17,6 +18,42 @@ sys.path.insert(0, str(project_root))
 from src.logging.logger_config import log_debug
 
 
+def xmp_candidate_names(photo_name: str) -> Tuple[str, ...]:
+    """
+    Get the possible XMP sidecar names of a photo, in order of preference.
+    
+    Args:
+        photo_name: File name of the photo (e.g. 'IMG_1234.HEIC')
+        
+    Returns:
+        Candidate names: with and without the photo extension, .xmp and .XMP
+    """
+    stem = os.path.splitext(photo_name)[0]
+    return (photo_name + '.xmp', photo_name + '.XMP', stem + '.xmp', stem + '.XMP')
+
+
+def aae_candidate_names(photo_name: str) -> Tuple[str, ...]:
+    """
+    Get the possible AAE sidecar names of a photo, in order of preference.
+    
+    Args:
+        photo_name: File name of the photo (e.g. 'IMG_1234.HEIC')
+        
+    Returns:
+        Candidate names: direct match (photo.aae), then the Apple Photos
+        IMG_O pattern (IMG_1234 -> IMG_O1234.aae) or the numeric O pattern
+        (1470 -> 1470O.aae), each as .aae and .AAE
+    """
+    stem = os.path.splitext(photo_name)[0]
+    candidates = (stem + '.aae', stem + '.AAE')
+    if stem.startswith('IMG_'):
+        number_part = stem[4:]
+        candidates += (f"IMG_O{number_part}.aae", f"IMG_O{number_part}.AAE")
+    elif stem.isdigit():
+        candidates += (f"{stem}O.aae", f"{stem}O.AAE")
+    return candidates
+
+
 def find_xmp_file(photo_path: Path) -> Optional[Path]:
     """
     Find the associated XMP file for a photo.
@@ -27,18 +64,11 @@ def find_xmp_file(photo_path: Path) -> Optional[Path]:
     Returns:
         Path to the XMP file if found, None otherwise
     """
-    # Try different XMP file naming patterns
-    patterns = [
-        photo_path.with_suffix(photo_path.suffix + '.xmp'),
-        photo_path.with_suffix(photo_path.suffix + '.XMP'),
-        photo_path.with_suffix('.xmp'),
-        photo_path.with_suffix('.XMP')
-    ]
-    
-    for pattern in patterns:
-        if pattern.exists():
-            log_debug(f"Found XMP file: {pattern.name}")
-            return pattern
+    for name in xmp_candidate_names(photo_path.name):
+        xmp_path = photo_path.parent / name
+        if xmp_path.exists():
+            log_debug(f"Found XMP file: {name}")
+            return xmp_path
     
     return None
 
@@ -53,46 +83,11 @@ def find_aae_file(photo_path: Path) -> Optional[Path]:
     Returns:
         Path to the AAE file if found, None otherwise
     """
-    # Pattern 1: Direct match (photo.jpg -> photo.aae)
-    aae_path = photo_path.with_suffix('.aae')
-    if aae_path.exists():
-        log_debug(f"Found AAE file (direct): {aae_path.name}")
-        return aae_path
-    
-    aae_path = photo_path.with_suffix('.AAE')
-    if aae_path.exists():
-        log_debug(f"Found AAE file (direct): {aae_path.name}")
-        return aae_path
-    
-    # Pattern 2: Apple Photos pattern (IMG_1234.HEIC -> IMG_O1234.aae)
-    photo_name = photo_path.stem
-    if photo_name.startswith('IMG_'):
-        number_part = photo_name[4:]
-        aae_name = f"IMG_O{number_part}.aae"
-        test_path = photo_path.parent / aae_name
-        if test_path.exists():
-            log_debug(f"Found AAE file (IMG_O pattern): {aae_name}")
-            return test_path
-        
-        aae_name = f"IMG_O{number_part}.AAE"
-        test_path = photo_path.parent / aae_name
-        if test_path.exists():
-            log_debug(f"Found AAE file (IMG_O pattern): {aae_name}")
-            return test_path
-    
-    # Pattern 3: Numeric pattern (1470.HEIC -> 1470O.aae)
-    if photo_name.isdigit():
-        aae_name = f"{photo_name}O.aae"
-        test_path = photo_path.parent / aae_name
-        if test_path.exists():
-            log_debug(f"Found AAE file (numeric O pattern): {aae_name}")
-            return test_path
-        
-        aae_name = f"{photo_name}O.AAE"
-        test_path = photo_path.parent / aae_name
-        if test_path.exists():
-            log_debug(f"Found AAE file (numeric O pattern): {aae_name}")
-            return test_path
+    for name in aae_candidate_names(photo_path.name):
+        aae_path = photo_path.parent / name
+        if aae_path.exists():
+            log_debug(f"Found AAE file: {name}")
+            return aae_path
     
     return None
 
@@ -24,6 +24,12 @@ from collections import defaultdict, deque
 import json
 import sys
 
+# Optional fast JSON serializer, stdlib json is used when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
@@ -202,6 +208,27 @@ class PerformanceMonitor:
         
         log_debug(f"Finished operation: {operation} ({timing.duration:.3f}s)")
     
+    def record_operation(self, operation: str, duration: float, success: bool = True,
+                         error_message: Optional[str] = None, **metadata):
+        """Record an operation that was timed elsewhere, e.g. in a worker process"""
+        if not self.enable_monitoring:
+            return
+        
+        end_time = time.time()
+        self.operation_timings[operation].append(OperationTiming(
+            operation=operation,
+            start_time=end_time - duration,
+            end_time=end_time,
+            duration=duration,
+            success=success,
+            error_message=error_message,
+            metadata=metadata
+        ))
+        self.total_operations += 1
+        if not success:
+            self.failed_operations += 1
+        self.total_processing_time += duration
+    
     def record_metric(self, name: str, value: float, unit: str = "", **context):
         """Record a custom metric"""
         if not self.enable_monitoring:
@@ -387,8 +414,13 @@ class PerformanceMonitor:
             'timestamp': datetime.now(timezone.utc).isoformat()
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        if orjson is not None:
+            Path(filepath).write_bytes(orjson.dumps(
+                data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
         
         log_info(f"Performance metrics saved to: {filepath}")
     
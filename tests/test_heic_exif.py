@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the HEIC Exif item reader in export_photos.
+
+The fixtures are minimal synthetic HEIC files: an ftyp box, a meta box with
+iinf/iloc entries for a single Exif item, and an mdat box holding that item.
+"""
+
+import struct
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image
+
+from src.core.export_photos import PhotoExporter, _first_exif_date, _read_heic_exif_dates
+
+CAPTURE_DATE = '2021:05:01 10:00:00'
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack('>I4s', 8 + len(payload), box_type) + payload
+
+
+def _full_box(box_type: bytes, version: int, payload: bytes) -> bytes:
+    return _box(box_type, bytes((version, 0, 0, 0)) + payload)
+
+
+def _exif_tiff() -> bytes:
+    exif = Image.Exif()
+    exif[0x0132] = CAPTURE_DATE  # DateTime
+    return exif.tobytes()[6:]  # Strip the 'Exif\0\0' APP1 prefix
+
+
+def _build_heic(with_exif: bool = True, item_count: int = 1,
+                extent_offset: int = None, extent_length: int = None) -> bytes:
+    """Build a HEIC with one Exif item; the iloc fields can be overridden to corrupt it"""
+    item = struct.pack('>I', 0) + _exif_tiff()
+    item_type = b'Exif' if with_exif else b'mime'
+    ftyp = _box(b'ftyp', b'heic' + b'\0\0\0\0' + b'mif1heic')
+    iinf = _full_box(b'iinf', 0, struct.pack('>H', 1) + _full_box(
+        b'infe', 2, struct.pack('>HH4s', 1, 0, item_type) + b'\0'))
+
+    def meta_box(offset: int) -> bytes:
+        # iloc version 0: 8-byte offsets and lengths, no base offset
+        iloc = _full_box(b'iloc', 0, struct.pack(
+            '>HHHHHQQ', 0x8800, item_count, 1, 0, 1,
+            offset if extent_offset is None else extent_offset,
+            len(item) if extent_length is None else extent_length))
+        return _full_box(b'meta', 0, iinf + iloc)
+
+    data_offset = len(ftyp) + len(meta_box(0)) + 8
+    return ftyp + meta_box(data_offset) + _box(b'mdat', item)
+
+
+def test_reads_exif_date(tmp_path):
+    heic = tmp_path / 'IMG_0001.HEIC'
+    heic.write_bytes(_build_heic())
+    dates = _read_heic_exif_dates(heic)
+    assert dates[0x0132] == CAPTURE_DATE
+    assert _first_exif_date(dates) == datetime(2021, 5, 1, 10, 0, tzinfo=timezone.utc)
+
+
+def test_file_without_exif_item(tmp_path):
+    heic = tmp_path / 'IMG_0002.HEIC'
+    heic.write_bytes(_build_heic(with_exif=False))
+    assert _read_heic_exif_dates(heic) == {}
+
+
+def test_extent_outside_file(tmp_path):
+    heic = tmp_path / 'IMG_0003.HEIC'
+    for offset, length in ((1 << 63, 64), (40, 1 << 62), (40, 0), (40, 1 << 20)):
+        heic.write_bytes(_build_heic(extent_offset=offset, extent_length=length))
+        assert _read_heic_exif_dates(heic) is None
+
+
+def test_item_count_larger_than_box(tmp_path):
+    heic = tmp_path / 'IMG_0004.HEIC'
+    heic.write_bytes(_build_heic(item_count=0xFFFF))
+    # Parsing stops at the end of the iloc box, after the one real item
+    assert _read_heic_exif_dates(heic)[0x0132] == CAPTURE_DATE
+
+
+def test_corrupt_file_falls_back_without_error(tmp_path):
+    heic = tmp_path / 'IMG_0005.HEIC'
+    heic.write_bytes(_build_heic(extent_offset=1 << 63))
+    exporter = PhotoExporter.__new__(PhotoExporter)
+    assert exporter._extract_heic_exif_date(heic) is None